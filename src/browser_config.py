@@ -12,6 +12,19 @@ from src.debug_config import get_debug_config, is_debug_mode, get_debug_browser_
 
 logger = get_logger(__name__)
 
+# Reuse a saved Playwright storage state (cookies + localStorage) across runs so
+# new contexts start logged in; src.easy_apply writes it after the first applied job
+USE_STORAGE_STATE = os.getenv('USE_STORAGE_STATE', 'false').lower() == 'true'
+STORAGE_STATE_PATH = Path(__file__).resolve().parent.parent / "playwright_state.json"
+
+
+def _storage_state_kwargs() -> Dict[str, Any]:
+    """new_context() kwargs that load the saved storage state, if enabled and present."""
+    if USE_STORAGE_STATE and STORAGE_STATE_PATH.exists():
+        logger.info("Loading saved browser storage state", file_path=str(STORAGE_STATE_PATH))
+        return {'storage_state': str(STORAGE_STATE_PATH)}
+    return {}
+
 class EnhancedBrowserConfig:
     """
     Enhanced browser configuration for LinkedIn automation with:
@@ -566,6 +579,7 @@ class EnhancedBrowserConfig:
                 device_scale_factor=1,
                 has_touch=False,
                 is_mobile=False,
+                **_storage_state_kwargs(),
             )
             
             # Add stealth script
@@ -595,7 +609,7 @@ class EnhancedBrowserConfig:
             app_config = config_manager.config
             
             # Extract stealth config
-            stealth_config = app_config.stealth_config.dict()
+            stealth_config = app_config.stealth_config.model_dump()
             
             # Add profile directory path
             stealth_config['profile_dir'] = str(Path('stealth_profiles'))
@@ -663,6 +677,7 @@ class EnhancedBrowserConfig:
                 device_scale_factor=1,
                 has_touch=False,
                 is_mobile=False,
+                **_storage_state_kwargs(),
             )
             
             # Add enhanced stealth script first
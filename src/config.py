@@ -9,11 +9,11 @@ while maintaining the same interface for existing code.
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
 from src.logging_config import get_logger, log_function_call, log_error_context
+from .config_migration import _load_dotenv_once
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once per process, shared with the config manager)
+_load_dotenv_once()
 
 # Import the new configuration system
 from .config_manager import get_config_manager, ConfigManager
@@ -224,33 +224,38 @@ class LazyConfig:
     def SUPPRESS_CONSOLE_WARNINGS(self) -> bool:
         return _get_config_manager().settings.suppress_console_warnings
     
+    @property
+    def HUMANIZE(self) -> bool:
+        settings = _get_config_manager().settings
+        return settings.humanize if settings.humanize is not None else not settings.headless_mode
+    
     @property
     def TIMEOUTS(self) -> Dict[str, int]:
-        return _get_config_manager().timeouts.dict()
+        return _get_config_manager().timeouts.model_dump()
     
     @property
     def RETRY_CONFIG(self) -> Dict[str, Any]:
-        return _get_config_manager().retry_config.dict()
+        return _get_config_manager().retry_config.model_dump()
     
     @property
     def LINKEDIN_SELECTORS(self) -> Dict[str, Any]:
-        return _get_config_manager().linkedin_selectors.dict()
+        return _get_config_manager().linkedin_selectors.model_dump()
     
     @property
     def FILE_PATHS(self) -> Dict[str, Path]:
-        return _get_config_manager().file_paths.dict()
+        return _get_config_manager().file_paths.model_dump()
     
     @property
     def SCROLL_CONFIG(self) -> Dict[str, Any]:
-        return _get_config_manager().scroll_config.dict()
+        return _get_config_manager().scroll_config.model_dump()
     
     @property
     def QUESTION_CONFIG(self) -> Dict[str, Any]:
-        return _get_config_manager().question_config.dict()
+        return _get_config_manager().question_config.model_dump()
     
     @property
     def DELAYS(self) -> Dict[str, Any]:
-        return _get_config_manager().delays.dict()
+        return _get_config_manager().delays.model_dump()
 
 
 # Create lazy config instance
@@ -272,6 +277,7 @@ DEBUG = _lazy_config.DEBUG
 HEADLESS_MODE = _lazy_config.HEADLESS_MODE
 ENABLE_BROWSER_MONITORING = _lazy_config.ENABLE_BROWSER_MONITORING
 SUPPRESS_CONSOLE_WARNINGS = _lazy_config.SUPPRESS_CONSOLE_WARNINGS
+HUMANIZE = _lazy_config.HUMANIZE
 TIMEOUTS = _lazy_config.TIMEOUTS
 RETRY_CONFIG = _lazy_config.RETRY_CONFIG
 LINKEDIN_SELECTORS = _lazy_config.LINKEDIN_SELECTORS
@@ -325,7 +331,7 @@ def get_personal_info() -> Dict[str, Any]:
     """
     try:
         config_manager = _get_config_manager()
-        return config_manager.personal_info.dict()
+        return config_manager.personal_info.model_dump()
     except Exception as e:
         logger.error(f"Failed to get personal info: {e}")
         return {}
@@ -338,7 +344,7 @@ def get_keyword_weights() -> Dict[str, Any]:
     """
     try:
         config_manager = _get_config_manager()
-        return config_manager.keyword_weights.dict()
+        return config_manager.keyword_weights.model_dump()
     except Exception as e:
         logger.error(f"Failed to get keyword weights: {e}")
         return {"tech": [], "methodology": [], "soft": []}
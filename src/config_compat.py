@@ -125,46 +125,52 @@ def _get_suppress_console_warnings() -> bool:
     return _get_config_manager().settings.suppress_console_warnings
 
 
+def _get_humanize() -> bool:
+    """Get human-like pause setting (defaults to off in headless mode)."""
+    settings = _get_config_manager().settings
+    return settings.humanize if settings.humanize is not None else not settings.headless_mode
+
+
 # Timeout Configuration
 def _get_timeouts() -> Dict[str, int]:
     """Get timeout configuration."""
-    return _get_config_manager().timeouts.dict()
+    return _get_config_manager().timeouts.model_dump()
 
 
 # Retry Configuration
 def _get_retry_config() -> Dict[str, Any]:
     """Get retry configuration."""
-    return _get_config_manager().retry_config.dict()
+    return _get_config_manager().retry_config.model_dump()
 
 
 # LinkedIn Selectors
 def _get_linkedin_selectors() -> Dict[str, Any]:
     """Get LinkedIn selectors."""
-    return _get_config_manager().linkedin_selectors.dict()
+    return _get_config_manager().linkedin_selectors.model_dump()
 
 
 # File Paths
 def _get_file_paths() -> Dict[str, Path]:
     """Get file paths."""
-    return _get_config_manager().file_paths.dict()
+    return _get_config_manager().file_paths.model_dump()
 
 
 # Scroll Configuration
 def _get_scroll_config() -> Dict[str, Any]:
     """Get scroll configuration."""
-    return _get_config_manager().scroll_config.dict()
+    return _get_config_manager().scroll_config.model_dump()
 
 
 # Question Answering Configuration
 def _get_question_config() -> Dict[str, Any]:
     """Get question configuration."""
-    return _get_config_manager().question_config.dict()
+    return _get_config_manager().question_config.model_dump()
 
 
 # Delay Configuration
 def _get_delays() -> Dict[str, Any]:
     """Get delay configuration."""
-    return _get_config_manager().delays.dict()
+    return _get_config_manager().delays.model_dump()
 
 
 # Lazy-loaded constants (same interface as old config.py)
@@ -227,6 +233,10 @@ class LazyConfig:
     def SUPPRESS_CONSOLE_WARNINGS(self) -> bool:
         return _get_suppress_console_warnings()
     
+    @property
+    def HUMANIZE(self) -> bool:
+        return _get_humanize()
+    
     @property
     def TIMEOUTS(self) -> Dict[str, int]:
         return _get_timeouts()
@@ -409,6 +419,7 @@ DEBUG = LazyConstant(_get_debug)
 HEADLESS_MODE = LazyConstant(_get_headless_mode)
 ENABLE_BROWSER_MONITORING = LazyConstant(_get_enable_browser_monitoring)
 SUPPRESS_CONSOLE_WARNINGS = LazyConstant(_get_suppress_console_warnings)
+HUMANIZE = LazyConstant(_get_humanize)
 TIMEOUTS = LazyConstant(_get_timeouts)
 RETRY_CONFIG = LazyConstant(_get_retry_config)
 LINKEDIN_SELECTORS = LazyConstant(_get_linkedin_selectors)
@@ -462,7 +473,7 @@ def get_personal_info() -> Dict[str, Any]:
     """
     try:
         config_manager = _get_config_manager()
-        return config_manager.personal_info.dict()
+        return config_manager.personal_info.model_dump()
     except Exception as e:
         logger.error(f"Failed to get personal info: {e}")
         return {}
@@ -475,7 +486,7 @@ def get_keyword_weights() -> Dict[str, Any]:
     """
     try:
         config_manager = _get_config_manager()
-        return config_manager.keyword_weights.dict()
+        return config_manager.keyword_weights.model_dump()
     except Exception as e:
         logger.error(f"Failed to get keyword weights: {e}")
         return {"tech": [], "methodology": [], "soft": []}
@@ -647,7 +658,7 @@ def migrate_from_old_config() -> None:
         from .config_migration import migrate_configuration
         migrated_config = migrate_configuration()
         
-        # Create a new config manager with migrated data
+        # The migration output is not a model_dump of AppConfig, so it must be validated
         global _config_manager
         from .config_manager import ConfigManager
         _config_manager = ConfigManager.from_dict(migrated_config)
@@ -5,18 +5,42 @@ Type-safe configuration manager using Pydantic schemas.
 This module provides a centralized way to load, validate, and access configuration.
 """
 
-from typing import Optional, Dict, Any
+import hashlib
+import os
+import pickle
+from functools import cached_property, lru_cache
+from typing import Optional, Dict, Any, Mapping, Type
 from pathlib import Path
-from dotenv import load_dotenv
-from src.logging_config import get_logger, log_function_call, log_error_context
-from .config_schemas import AppConfig, AppSettings, PersonalInfo, KeywordWeights
-
-# Load environment variables from .env file
-load_dotenv()
+from pydantic import BaseModel
+from src.logging_config import get_logger
+from . import config_schemas
+from .config_schemas import AppConfig, AppSettings, PersonalInfo, KeywordWeights, _ensure_required_dirs
+from .config_migration import _load_dotenv_once
 
 logger = get_logger(__name__)
 
 
+def _construct_trusted(model_cls: Type[BaseModel], data: Mapping[str, Any]) -> BaseModel:
+    """
+    Build a model without validation, constructing nested submodels from mappings.
+    
+    model_construct() does not recurse, so mapping values for fields annotated
+    with a model class are constructed the same way to keep attribute access working.
+    """
+    values = {}
+    for name, value in data.items():
+        field = model_cls.model_fields.get(name)
+        annotation = field.annotation if field is not None else None
+        if (
+            isinstance(value, Mapping)
+            and isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+        ):
+            value = _construct_trusted(annotation, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
 class ConfigManager:
     """
     Centralized configuration manager with type safety and validation.
@@ -25,6 +49,18 @@ class ConfigManager:
     throughout the application, with automatic validation and error handling.
     """
     
+    # Cached properties derived from settings, cleared by update_settings
+    _SETTINGS_CACHED_PROPERTIES = (
+        "linkedin_email", "linkedin_password", "max_jobs",
+        "auto_apply", "debug", "headless_mode",
+    )
+    
+    # Cached sub-config references, cleared when the whole config is replaced
+    _CONFIG_CACHED_PROPERTIES = (
+        "file_paths", "timeouts", "retry_config", "delays",
+        "linkedin_selectors", "question_config", "scroll_config", "browser_config",
+    )
+    
     def __init__(self, config: Optional[AppConfig] = None):
         """
         Initialize the configuration manager.
@@ -34,6 +70,7 @@ class ConfigManager:
         """
         self._config = config
         self._initialized = config is not None
+        self._summary_cache: Optional[Dict[str, Any]] = None
     
     @classmethod
     def from_files(
@@ -57,6 +94,7 @@ class ConfigManager:
             ValueError: If configuration files cannot be loaded or validated
         """
         try:
+            _load_dotenv_once(env_file)
             config = AppConfig.load_from_files(
                 personal_info_path=personal_info_path,
                 keyword_weights_path=keyword_weights_path,
@@ -87,12 +125,32 @@ class ConfigManager:
             logger.error(f"Failed to load configuration from dictionary: {e}")
             raise ValueError(f"Configuration loading failed: {e}")
     
+    @classmethod
+    def from_trusted_dict(cls, config_dict: Mapping[str, Any]) -> "ConfigManager":
+        """
+        Create ConfigManager from a dictionary without re-running validation.
+        
+        Only use this for data produced by this package (e.g. migration output
+        or a previous model_dump); untrusted input should go through from_dict.
+        
+        Args:
+            config_dict: Dictionary containing already-validated configuration data
+            
+        Returns:
+            ConfigManager: Initialized configuration manager
+        """
+        config = _construct_trusted(AppConfig, config_dict)
+        logger.info("Configuration constructed from trusted dictionary")
+        return cls(config)
+    
     def initialize(self) -> None:
         """Initialize the configuration if not already done."""
         if not self._initialized:
             try:
+                _load_dotenv_once()
                 self._config = AppConfig.load_from_files()
                 self._initialized = True
+                self._invalidate_caches()
                 logger.info("Configuration initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize configuration: {e}")
@@ -101,7 +159,7 @@ class ConfigManager:
     @property
     def config(self) -> AppConfig:
         """Get the complete configuration object."""
-        if not self._initialized:
+        if self._config is None:
             self.initialize()
         return self._config
     
@@ -121,79 +179,80 @@ class ConfigManager:
         """Get keyword weights configuration."""
         return self.config.keyword_weights
     
-    @property
+    @cached_property
     def linkedin_email(self) -> str:
         """Get LinkedIn email."""
         return self.settings.linkedin_email
     
-    @property
+    @cached_property
     def linkedin_password(self) -> str:
         """Get LinkedIn password."""
         return self.settings.linkedin_password
     
-    @property
+    @cached_property
     def max_jobs(self) -> int:
         """Get maximum jobs to scrape."""
         return self.settings.max_jobs
     
-    @property
+    @cached_property
     def auto_apply(self) -> bool:
         """Get auto-apply setting."""
         return self.settings.auto_apply
     
-    @property
+    @cached_property
     def debug(self) -> bool:
         """Get debug mode setting."""
         return self.settings.debug
     
-    @property
+    @cached_property
     def headless_mode(self) -> bool:
         """Get headless mode setting."""
         return self.settings.headless_mode
     
-    @property
+    @cached_property
     def file_paths(self):
         """Get file paths configuration."""
         return self.config.file_paths
     
-    @property
+    @cached_property
     def timeouts(self):
         """Get timeout configuration."""
         return self.config.timeouts
     
-    @property
+    @cached_property
     def retry_config(self):
         """Get retry configuration."""
         return self.config.retry_config
     
-    @property
+    @cached_property
     def delays(self):
         """Get delay configuration."""
         return self.config.delays
     
-    @property
+    @cached_property
     def linkedin_selectors(self):
         """Get LinkedIn selectors configuration."""
         return self.config.linkedin_selectors
     
-    @property
+    @cached_property
     def question_config(self):
         """Get question configuration."""
         return self.config.question_config
     
-    @property
+    @cached_property
     def scroll_config(self):
         """Get scroll configuration."""
         return self.config.scroll_config
     
-    @property
+    @cached_property
     def browser_config(self):
         """Get browser configuration."""
         return self.config.browser_config
     
     def validate_credentials(self) -> bool:
         """Validate that required credentials are present."""
-        return self.config.validate_linkedin_credentials()
+        # Same check as AppConfig.validate_linkedin_credentials, via the cached properties
+        return bool(self.linkedin_email) and bool(self.linkedin_password)
     
     def get_resume_template_path(self) -> Path:
         """Get the path to the resume template."""
@@ -221,13 +280,17 @@ class ConfigManager:
             **kwargs: Fields to update in personal information
         """
         try:
-            # Create updated personal info
-            current_data = self.personal_info.dict()
-            current_data.update(kwargs)
-            updated_personal_info = PersonalInfo(**current_data)
+            # Copy the current model and validate only the changed fields
+            updated_personal_info = self.personal_info.model_copy()
+            validator = PersonalInfo.__pydantic_validator__
+            for field_name, value in kwargs.items():
+                validator.validate_assignment(updated_personal_info, field_name, value)
+            # validate_assignment bypasses __setattr__, so drop the copied dump cache here
+            updated_personal_info._dump_cache = None
             
             # Update the config
             self.config.personal_info = updated_personal_info
+            self._summary_cache = None
             logger.info("Personal information updated successfully")
         except Exception as e:
             logger.error(f"Failed to update personal information: {e}")
@@ -241,26 +304,46 @@ class ConfigManager:
             **kwargs: Settings to update
         """
         try:
-            # Create updated settings
-            current_data = self.settings.dict()
-            current_data.update(kwargs)
-            updated_settings = AppSettings(**current_data)
+            # Copy the current settings and validate only the changed fields
+            updated_settings = self.settings.model_copy()
+            validator = AppSettings.__pydantic_validator__
+            for field_name, value in kwargs.items():
+                validator.validate_assignment(updated_settings, field_name, value)
             
             # Update the config
             self.config.settings = updated_settings
+            self._summary_cache = None
+            self._invalidate_cached_properties(self._SETTINGS_CACHED_PROPERTIES)
             logger.info("Application settings updated successfully")
         except Exception as e:
             logger.error(f"Failed to update settings: {e}")
             raise ValueError(f"Settings update failed: {e}")
     
+    def _invalidate_cached_properties(self, names) -> None:
+        """Drop cached_property values so they are recomputed on next access."""
+        for name in names:
+            self.__dict__.pop(name, None)
+    
+    def _invalidate_caches(self) -> None:
+        """Drop every cached value derived from the current configuration."""
+        self._summary_cache = None
+        self._invalidate_cached_properties(self._SETTINGS_CACHED_PROPERTIES)
+        self._invalidate_cached_properties(self._CONFIG_CACHED_PROPERTIES)
+    
     def get_config_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the current configuration for debugging.
         
+        The summary is cached until the configuration is updated, so callers
+        should treat the returned dict as read-only.
+        
         Returns:
             Dict containing configuration summary (excluding sensitive data)
         """
-        return {
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
+        self._summary_cache = {
             "debug_mode": self.debug,
             "max_jobs": self.max_jobs,
             "auto_apply": self.auto_apply,
@@ -275,9 +358,10 @@ class ConfigManager:
                 "templates_dir": str(self.file_paths.templates_dir),
                 "output_dir": str(self.file_paths.output_dir),
             },
-            "timeouts": self.timeouts.dict(),
-            "retry_config": self.retry_config.dict(),
+            "timeouts": self.timeouts.model_dump(mode="python"),
+            "retry_config": self.retry_config.model_dump(mode="python"),
         }
+        return self._summary_cache
     
     def __repr__(self) -> str:
         """String representation of the configuration manager."""
@@ -287,6 +371,73 @@ class ConfigManager:
 # Global configuration manager instance
 _config_manager: Optional[ConfigManager] = None
 
+# Pickled AppConfig reused across processes while its sources are unchanged.
+# Settings (which hold the LinkedIn credentials) are never pickled; they are
+# re-read from the environment on every cache hit.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_CONFIG_CACHE_PATH = config_schemas._CACHE_DIR / "app_config.pickle"
+# Input files relative to the base directory, matching AppConfig.load_from_files
+_CONFIG_CACHE_SOURCES = (
+    Path("personal_info.yaml"),
+    Path(".env"),
+    Path("src") / "keyword_weights.json",
+    Path("src") / "stopwords.json",
+    Path("src") / "tech_dictionary.json",
+)
+
+
+@lru_cache(maxsize=1)
+def _config_schema_version() -> str:
+    """Hash of the code that shapes the cached AppConfig, so upgrades invalidate the cache."""
+    digest = hashlib.sha256(config_schemas._schema_version().encode("utf-8"))
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _config_cache_key() -> str:
+    """Key the config cache on the schema version, every source file and the settings env vars."""
+    base_dir = Path(os.environ.get("BASE_DIR") or _PROJECT_ROOT)
+    parts = [_config_schema_version(), str(base_dir)]
+    for relative in _CONFIG_CACHE_SOURCES:
+        path = base_dir / relative
+        try:
+            st = path.stat()
+            parts.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            parts.append((str(path), None))
+    for name in sorted(AppSettings.model_fields):
+        parts.append((name, os.environ.get(name.upper())))
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _load_cached_config(key: str) -> Optional[AppConfig]:
+    """Return the pickled AppConfig with fresh settings if it was stored under the same key."""
+    try:
+        with open(_CONFIG_CACHE_PATH, "rb") as f:
+            cached_key, config = pickle.load(f)
+        if cached_key != key or not isinstance(config, AppConfig):
+            return None
+        config = config.model_copy(update={"settings": AppSettings()})
+        # Same side effect AppConfig's validator has on a fresh load
+        _ensure_required_dirs(config.file_paths)
+    except Exception:
+        return None
+    return config
+
+
+def _store_cached_config(key: str, config: AppConfig) -> None:
+    """Pickle the AppConfig minus its settings for later processes; failures are non-fatal."""
+    try:
+        _CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CONFIG_CACHE_PATH.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, config.model_copy(update={"settings": None})), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _CONFIG_CACHE_PATH)
+    except Exception as e:
+        logger.debug("Failed to write configuration cache", error=str(e))
+
 
 def get_config_manager() -> ConfigManager:
     """
@@ -297,7 +448,15 @@ def get_config_manager() -> ConfigManager:
     """
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager.from_files()
+        _load_dotenv_once()
+        key = _config_cache_key()
+        config = _load_cached_config(key)
+        if config is not None:
+            logger.info("Configuration loaded from cache")
+            _config_manager = ConfigManager(config)
+        else:
+            _config_manager = ConfigManager.from_files()
+            _store_cached_config(key, _config_manager.config)
     return _config_manager
 
 
@@ -5,19 +5,104 @@ Comprehensive type-safe configuration management using Pydantic.
 This module defines all configuration schemas for the resume generator application.
 """
 
-from typing import Dict, List, Optional, Union, Any, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Dict, FrozenSet, List, Optional, Union, Any, Tuple
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+import pydantic
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator, model_validator, ConfigDict
 from pydantic_settings import BaseSettings
+import hashlib
+import json
 import os
+import re
+import sys
+import yaml
 from datetime import datetime
 from src.logging_config import get_logger, log_function_call, log_error_context
 
 logger = get_logger(__name__)
 
+# Project root, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-class Address(BaseModel):
-    """Address information schema."""
+# Per-user cache directory for derived state (validation stamps, config cache)
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "resume-gen-auto-applier"
+)
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Validator patterns, compiled once at import
+_GRAD_DATE_RE = re.compile(r'\d{2}-\d{4}')
+_LINKEDIN_PREFIX = 'https://www.linkedin.com/'
+_GITHUB_PREFIX = 'https://github.com/'
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@lru_cache(maxsize=512)
+def _sanitize_filename_part(value: str) -> str:
+    """Reduce a job title or company name to filename-safe characters."""
+    return _UNSAFE_FILENAME_RE.sub('', value.replace(" ", "_"))
+
+
+def _read_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, using the libyaml-backed loader when available."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=CSafeLoader)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file with orjson, falling back to the stdlib parser."""
+    if orjson is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Write indented JSON with orjson, falling back to the stdlib encoder."""
+    if orjson is None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return
+    Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+class _DeferredModel(BaseModel):
+    """Base schema that defers core-schema construction until first validation."""
+    model_config = ConfigDict(defer_build=True)
+
+
+class _CachedDumpModel(_DeferredModel):
+    """Base schema that reuses its model_dump() output until a field is reassigned."""
+    _dump_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._dump_cache = None
+    
+    def cached_dump(self) -> Dict[str, Any]:
+        """Return model_dump() output; treat the result as read-only."""
+        if self._dump_cache is None:
+            self._dump_cache = self.model_dump(mode="python")
+        return self._dump_cache
+
+
+@dataclass(slots=True, frozen=True)
+class Address:
+    """Address information schema (a slotted dataclass; validated when nested in PersonalInfo)."""
     street: str
     city: str
     state: str
@@ -25,7 +110,7 @@ class Address(BaseModel):
     country: str = "USA"
 
 
-class Education(BaseModel):
+class Education(_DeferredModel):
     """Education information schema."""
     degree: str
     institution: str
@@ -39,13 +124,12 @@ class Education(BaseModel):
         if not isinstance(v, str):
             raise ValueError('Graduation date must be a string')
         # Check for MM-YYYY format
-        import re
-        if not re.match(r'^\d{2}-\d{4}$', v):
+        if not _GRAD_DATE_RE.fullmatch(v):
             raise ValueError('Graduation date must be in MM-YYYY format')
         return v
 
 
-class JobHistory(BaseModel):
+class JobHistory(_DeferredModel):
     """Job history entry schema."""
     title: str
     company: str
@@ -65,20 +149,21 @@ class JobHistory(BaseModel):
         return v
 
 
-class ReferenceContact(BaseModel):
-    """Reference contact information schema."""
+@dataclass(slots=True, frozen=True)
+class ReferenceContact:
+    """Reference contact information schema (a slotted dataclass; validated when nested)."""
     email: str
     phone: str
 
 
-class Reference(BaseModel):
+class Reference(_DeferredModel):
     """Reference information schema."""
     name: str
     title: str
     contact: ReferenceContact
 
 
-class PersonalInfo(BaseModel):
+class PersonalInfo(_CachedDumpModel):
     """Complete personal information schema."""
     first_name: str
     last_name: str
@@ -96,7 +181,8 @@ class PersonalInfo(BaseModel):
     @classmethod
     def validate_email(cls, v):
         """Basic email validation."""
-        if '@' not in v or '.' not in v.split('@')[1]:
+        _, at, domain = v.partition('@')
+        if not at or '.' not in domain.partition('@')[0]:
             raise ValueError('Invalid email format')
         return v
     
@@ -104,37 +190,77 @@ class PersonalInfo(BaseModel):
     @classmethod
     def validate_linkedin(cls, v):
         """Validate LinkedIn URL."""
-        if not v.startswith('https://www.linkedin.com/'):
-            raise ValueError('LinkedIn URL must start with https://www.linkedin.com/')
+        if not v.startswith(_LINKEDIN_PREFIX):
+            raise ValueError(f'LinkedIn URL must start with {_LINKEDIN_PREFIX}')
         return v
     
     @field_validator('github')
     @classmethod
     def validate_github(cls, v):
         """Validate GitHub URL if provided."""
-        if v and not v.startswith('https://github.com/'):
-            raise ValueError('GitHub URL must start with https://github.com/')
+        if v and not v.startswith(_GITHUB_PREFIX):
+            raise ValueError(f'GitHub URL must start with {_GITHUB_PREFIX}')
         return v
 
 
-class TimeoutConfig(BaseModel):
+# Written next to personal_info.yaml once its current contents pass validation
+@lru_cache(maxsize=1)
+def _schema_version() -> str:
+    """Hash of this module's source and the pydantic version; changes whenever the schemas may have."""
+    digest = hashlib.sha256()
+    digest.update(pydantic.VERSION.encode("utf-8"))
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _validated_stamp_path(path: Path) -> Path:
+    """Where the 'passed validation' stamp for a personal info file lives, under _CACHE_DIR."""
+    name = hashlib.sha256(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return _CACHE_DIR / f"personal_info-{name}.validated"
+
+
+def _personal_info_stamp(path: Path) -> str:
+    """Identify the current version of the personal info file and of the schema validating it."""
+    stat_result = os.stat(path)
+    return f"{_schema_version()}:{Path(path).resolve()}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
+
+def _construct_personal_info(data: Dict[str, Any]) -> PersonalInfo:
+    """Build PersonalInfo from already-validated data without running validators."""
+    data = dict(data)
+    data["address"] = Address(**data["address"])
+    data["job_history"] = [JobHistory.model_construct(**job) for job in data.get("job_history") or []]
+    data["education"] = [Education.model_construct(**edu) for edu in data.get("education") or []]
+    data["references"] = [
+        Reference.model_construct(**{**ref, "contact": ReferenceContact(**ref["contact"])})
+        for ref in data.get("references") or []
+    ]
+    return PersonalInfo.model_construct(**data)
+
+
+# Timeout in milliseconds; one shared constraint for every TimeoutConfig field
+_Millis = Annotated[int, Field(ge=1000, le=300000)]
+
+
+class TimeoutConfig(_DeferredModel):
     """Timeout configuration schema."""
-    page_load: int = Field(default=30000, ge=1000, le=300000)
-    login: int = Field(default=30000, ge=1000, le=300000)
-    search_page: int = Field(default=45000, ge=1000, le=300000)
-    job_page: int = Field(default=30000, ge=1000, le=300000)
-    job_title: int = Field(default=15000, ge=1000, le=300000)
-    modal_wait: int = Field(default=20000, ge=1000, le=300000)
-    easy_apply_click: int = Field(default=5000, ge=1000, le=300000)
-    login_success: int = Field(default=5000, ge=1000, le=300000)
-    job_list: int = Field(default=10000, ge=1000, le=300000)
-    job_cards: int = Field(default=10000, ge=1000, le=300000)
-    total_jobs: int = Field(default=5000, ge=1000, le=300000)
-    dom_refresh: int = Field(default=3000, ge=1000, le=300000)
-    radio_click: int = Field(default=3000, ge=1000, le=300000)
-
-
-class RetryConfig(BaseModel):
+    page_load: _Millis = 30000
+    login: _Millis = 30000
+    search_page: _Millis = 45000
+    job_page: _Millis = 30000
+    job_title: _Millis = 15000
+    modal_wait: _Millis = 20000
+    easy_apply_click: _Millis = 5000
+    login_success: _Millis = 5000
+    job_list: _Millis = 10000
+    job_cards: _Millis = 10000
+    total_jobs: _Millis = 5000
+    dom_refresh: _Millis = 3000
+    radio_click: _Millis = 3000
+
+
+class RetryConfig(_DeferredModel):
     """Retry configuration schema."""
     max_attempts: int = Field(default=3, ge=1, le=10)
     retry_delay: float = Field(default=1.0, ge=0.1, le=10.0)
@@ -142,7 +268,7 @@ class RetryConfig(BaseModel):
     max_steps: int = Field(default=10, ge=1, le=20)
 
 
-class ScrollConfig(BaseModel):
+class ScrollConfig(_DeferredModel):
     """Scroll configuration schema."""
     base_speed: int = Field(default=350, ge=50, le=1000)
     min_speed: int = Field(default=150, ge=50, le=500)
@@ -153,7 +279,7 @@ class ScrollConfig(BaseModel):
     upward_scroll_range: Tuple[int, int] = Field(default=(50, 150))
 
 
-class DelayConfig(BaseModel):
+class DelayConfig(_DeferredModel):
     """Delay configuration schema."""
     login_processing: float = Field(default=3.0, ge=0.1, le=10.0)
     ui_stability: float = Field(default=0.2, ge=0.1, le=2.0)
@@ -168,15 +294,20 @@ class DelayConfig(BaseModel):
     session_recovery_wait: Tuple[float, float] = Field(default=(3.0, 5.0))
 
 
-class QuestionConfig(BaseModel):
+# Immutable question defaults shared by every QuestionConfig
+_SKIP_QUESTIONS: FrozenSet[str] = frozenset({
+    "email address", "phone country code", "mobile phone number",
+    "first name", "last name", "city", "address"
+})
+_IGNORE_KEYWORDS: FrozenSet[str] = frozenset({
+    "phone", "email address", "country code"
+})
+
+
+class QuestionConfig(_DeferredModel):
     """Question answering configuration schema."""
-    skip_questions: List[str] = Field(default_factory=lambda: [
-        "email address", "phone country code", "mobile phone number",
-        "first name", "last name", "city", "address"
-    ])
-    ignore_keywords: List[str] = Field(default_factory=lambda: [
-        "phone", "email address", "country code"
-    ])
+    skip_questions: FrozenSet[str] = _SKIP_QUESTIONS
+    ignore_keywords: FrozenSet[str] = _IGNORE_KEYWORDS
     default_answers: Dict[str, str] = Field(default_factory=lambda: {
         "sponsorship": "No",
         "onsite_work": "Yes",
@@ -187,9 +318,14 @@ class QuestionConfig(BaseModel):
         "convicted": "No",
         "default": "Yes"
     })
+    
+    @field_serializer('skip_questions', 'ignore_keywords')
+    def _serialize_phrase_set(self, value: FrozenSet[str]) -> List[str]:
+        """Dump phrase sets as sorted lists to keep the legacy dict shape."""
+        return sorted(value)
 
 
-class StealthConfig(BaseModel):
+class StealthConfig(_DeferredModel):
     """Stealth session configuration schema."""
     
     # Session Management
@@ -223,7 +359,7 @@ class StealthConfig(BaseModel):
     profile_cleanup_age_days: int = Field(default=30, ge=1, le=90, description="Profile cleanup age in days")
 
 
-class LinkedInSelectors(BaseModel):
+class LinkedInSelectors(_DeferredModel):
     """LinkedIn CSS selectors configuration schema."""
     login: Dict[str, str]
     login_fallbacks: List[str]
@@ -237,7 +373,7 @@ class LinkedInSelectors(BaseModel):
     form_fields: Dict[str, str]
 
 
-class FilePaths(BaseModel):
+class FilePaths(_DeferredModel):
     """File paths configuration schema."""
     personal_info: Path
     job_urls: Path
@@ -259,14 +395,14 @@ class FilePaths(BaseModel):
         return values
 
 
-class KeywordWeights(BaseModel):
+class KeywordWeights(_CachedDumpModel):
     """Keyword weights configuration schema."""
     tech: List[str] = Field(default_factory=list)
     methodology: List[str] = Field(default_factory=list)
     soft: List[str] = Field(default_factory=list)
 
 
-class BrowserConfig(BaseModel):
+class BrowserConfig(_DeferredModel):
     """Browser configuration schema."""
     headless: bool = Field(default=False)
     debug: bool = Field(default=False)
@@ -283,7 +419,7 @@ class AppSettings(BaseSettings):
     """Main application settings schema using Pydantic Settings."""
     
     # Base Configuration
-    base_dir: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
+    base_dir: Path = Field(default_factory=lambda: _PROJECT_ROOT)
     debug: bool = Field(default=False)
     
     # LinkedIn Credentials
@@ -303,6 +439,7 @@ class AppSettings(BaseSettings):
     headless_mode: bool = Field(default=False, description="Run browser in headless mode")
     enable_browser_monitoring: bool = Field(default=False, description="Monitor browser connection (disabled by default due to false positives)")
     suppress_console_warnings: bool = Field(default=True, description="Suppress harmless browser warnings")
+    humanize: Optional[bool] = Field(default=None, description="Add human-like pauses around clicks (unset: on unless headless)")
     
     # LLM Configuration
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
@@ -315,12 +452,208 @@ class AppSettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        validate_assignment=True,
+        defer_build=True,
         extra="ignore"  # Ignore extra environment variables
     )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Settings are read-only after load, so assignments are only re-validated
+        while debugging. Decided per instance from the loaded debug flag rather
+        than at import, because .env is loaded after this module is imported.
+        """
+        if self.__dict__.get("debug") and name in type(self).model_fields:
+            type(self).__pydantic_validator__.validate_assignment(self, name, value)
+        else:
+            super().__setattr__(name, value)
 
 
-class AppConfig(BaseModel):
+# Directories AppConfig creates on validation: (label, FilePaths attribute)
+_REQUIRED_DIRS = (
+    ("resumes", "resumes_dir"),
+    ("templates", "templates_dir"),
+    ("output", "output_dir"),
+)
+
+
+def _ensure_required_dirs(file_paths: "FilePaths") -> None:
+    """Create the output/template directories; mkdir fails fast with FileExistsError on the common path."""
+    for dir_name, attr_name in _REQUIRED_DIRS:
+        dir_path = getattr(file_paths, attr_name)
+        try:
+            dir_path.mkdir(parents=True)
+            logger.info("Created directory", dir_name=dir_name, dir_path=str(dir_path))
+        except FileExistsError:
+            pass
+        except Exception as e:
+            raise ValueError(f"Cannot create {dir_name} directory {dir_path}: {e}")
+
+
+# Default LinkedIn selectors, validated once by _default_linkedin_selectors()
+_LINKEDIN_SELECTORS_DATA: Dict[str, Any] = {
+    "login": {
+        "username": 'input[id="username"]',
+        "password": 'input[id="password"]',
+        "submit": 'button[type="submit"]',
+    },
+    "login_fallbacks": [
+        'input[name="session_key"]',
+        'input[name="session_password"]',
+        'input[type="email"]',
+        'input[type="password"]',
+        'button:has-text("Sign in")',
+        'button:has-text("Log in")'
+    ],
+    "login_success": [
+        'nav[aria-label="Primary"]',
+        'div[data-test-id="feed-identity-module"]',
+        '.feed-shared-update-v2',
+        '.global-nav',
+        'main[role="main"]',
+        '.application-outlet'
+    ],
+    "job_search": {
+        "job_list": "div.scaffold-layout__list.jobs-semantic-search-list",
+        "total_jobs": "div.t-black--light.pv4.text-body-small.mr2",
+        "job_cards": "ul.semantic-search-results-list > li",
+        "job_wrapper": "div.job-card-job-posting-card-wrapper, div.base-card",
+    },
+    "job_detail": {
+        "title": [
+            'h1.t-24.t-bold.inline',
+            'h1.jobs-unified-top-card__job-title',
+            'h1.top-card-layout__title'
+        ],
+        "company": [
+            'div.job-details-jobs-unified-top-card__company-name a',
+            'a.topcard__org-name-link'
+        ],
+        "location": 'span.tvm__text.tvm__text--low-emphasis',
+        "description": [
+            'div.jobs-description__content',
+            'div.jobs-description-content__text',
+            'div.jobs-box__html-content',
+            'div.jobs-unified-top-card__job-description',
+            'div.jobs-details__main-content',
+            'div[data-test-id="job-description"]',
+            'div.jobs-box__html-content div',
+            'div.jobs-description div',
+            'div.jobs-unified-top-card__content--main div',
+            'div.jobs-details__main-content div'
+        ],
+        "unavailable": "div.jobs-unavailable",
+    },
+    "easy_apply": {
+        "button": [
+            'div.jobs-apply-button--top-card button.jobs-apply-button',
+            'button[data-test-id="apply-button"]',
+            'button:has-text("Easy Apply")',
+            'button:has-text("Apply")',
+            'button[aria-label*="Apply"]',
+            'div.jobs-apply-button button',
+            'button.jobs-apply-button'
+        ],
+        "modal": [
+            'div.jobs-easy-apply-modal[role="dialog"]',
+            'div.artdeco-modal.jobs-easy-apply-modal',
+            'div[role="dialog"]',
+            'div.artdeco-modal',
+            'div.jobs-easy-apply-modal'
+        ],
+        "submit": [
+            'button[aria-label="Submit application"]',
+            'button:has-text("Submit application")',
+            'button:has-text("Submit")',
+            'button[data-test-id="submit-button"]'
+        ],
+        "review": [
+            'button[aria-label="Review your application"]',
+            'button:has-text("Review your application")',
+            'button:has-text("Review")',
+            'button[data-test-id="review-button"]'
+        ],
+        "next": [
+            'button[aria-label="Continue to next step"]',
+            'button:has-text("Continue to next step")',
+            'button:has-text("Next")',
+            'button:has-text("Continue")',
+            'button[data-test-id="next-button"]'
+        ],
+        "follow_checkbox": [
+            "input#follow-company-checkbox",
+            "input[name='follow-company']",
+            "input[type='checkbox'][id*='follow']"
+        ],
+        "follow_label": [
+            "label[for='follow-company-checkbox']",
+            "label[for*='follow']"
+        ],
+        "dismiss": [
+            'button[aria-label="Dismiss"]',
+            'button:has-text("Dismiss")',
+            'button:has-text("Close")',
+            'button[data-test-id="dismiss-button"]'
+        ],
+    },
+    "easy_apply_fallbacks": [
+        'button:has-text("Easy Apply")',
+        'button:has-text("Apply")',
+        'button[aria-label*="Apply"]',
+        'button[data-test-id*="apply"]',
+        'div[role="dialog"]',
+        'div.artdeco-modal',
+        'button:has-text("Submit")',
+        'button:has-text("Next")',
+        'button:has-text("Continue")'
+    ],
+    "resume_upload": {
+        "upload_button": 'label.jobs-document-upload__upload-button',
+        "file_input": "div.js-jobs-document-upload__container input[type='file'][id*='upload-resume']",
+    },
+    "application_status": {
+        "applied_banner": "div.post-apply-timeline__content",
+        "applied_text": "Application submitted",
+        "no_longer_accepting": [
+            "div:has-text('No longer accepting applications')",
+            "span:has-text('No longer accepting applications')",
+            "p:has-text('No longer accepting applications')",
+            "[data-test-id*='no-longer-accepting']",
+            ".jobs-apply-button--disabled:has-text('No longer accepting')"
+        ],
+        "confirmation": [
+            'div.jobs-apply-confirmation',
+            'div.post-apply-timeline__content',
+            'a[aria-label="Download your submitted resume"]',
+            'button.jobs-apply-button[aria-label*="Applied"]'
+        ]
+    },
+    "form_fields": {
+        "radio_fieldset": "fieldset[data-test-form-builder-radio-button-form-component='true']",
+        "radio_input": "input[type='radio']",
+        "dropdown": "select.fb-dash-form-element__select-dropdown",
+        "dropdown_label": "xpath=preceding-sibling::label[1]",
+    }
+}
+
+
+def _intern_strings(value: Any) -> Any:
+    """Recursively sys.intern every string so repeated selectors share one object."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=1)
+def _default_linkedin_selectors() -> LinkedInSelectors:
+    """Build the default selectors once; the instance is shared by every AppConfig."""
+    return LinkedInSelectors(**_intern_strings(_LINKEDIN_SELECTORS_DATA))
+
+
+class AppConfig(_DeferredModel):
     """Complete application configuration schema."""
     
     # Core settings
@@ -354,18 +687,7 @@ class AppConfig(BaseModel):
         if not file_paths:
             raise ValueError("File paths are required")
         
-        # Ensure directories exist
-        for dir_name, dir_path in [
-            ("resumes", file_paths.resumes_dir),
-            ("templates", file_paths.templates_dir),
-            ("output", file_paths.output_dir)
-        ]:
-            if not dir_path.exists():
-                try:
-                    dir_path.mkdir(parents=True, exist_ok=True)
-                    logger.info("Created directory", dir_name=dir_name, dir_path=str(dir_path))
-                except Exception as e:
-                    raise ValueError(f"Cannot create {dir_name} directory {dir_path}: {e}")
+        _ensure_required_dirs(file_paths)
         
         return model
     
@@ -375,7 +697,8 @@ class AppConfig(BaseModel):
         personal_info_path: Optional[Path] = None,
         keyword_weights_path: Optional[Path] = None,
         linkedin_selectors_path: Optional[Path] = None,
-        env_file: Optional[Path] = None
+        env_file: Optional[Path] = None,
+        validate: Optional[bool] = None
     ) -> "AppConfig":
         """
         Load configuration from files.
@@ -385,13 +708,12 @@ class AppConfig(BaseModel):
             keyword_weights_path: Path to keyword_weights.json
             linkedin_selectors_path: Path to linkedin_selectors.json (optional)
             env_file: Path to .env file
+            validate: Fully validate personal info. None validates only when the
+                file or the schema changed since it last passed validation.
             
         Returns:
             AppConfig: Complete configuration object
         """
-        import yaml
-        import json
-        
         # Load settings from environment
         settings = AppSettings(_env_file=env_file)
         
@@ -403,16 +725,29 @@ class AppConfig(BaseModel):
         
         # Load personal information
         try:
-            with open(personal_info_path, 'r', encoding='utf-8') as f:
-                personal_data = yaml.safe_load(f)
-            personal_info = PersonalInfo(**personal_data)
+            personal_data = _read_yaml_file(personal_info_path)
+            stamp = _personal_info_stamp(personal_info_path)
+            stamp_path = _validated_stamp_path(personal_info_path)
+            if validate is None:
+                try:
+                    validate = stamp_path.read_text(encoding='utf-8') != stamp
+                except OSError:
+                    validate = True
+            if validate:
+                personal_info = PersonalInfo(**personal_data)
+                try:
+                    stamp_path.parent.mkdir(parents=True, exist_ok=True)
+                    stamp_path.write_text(stamp, encoding='utf-8')
+                except OSError:
+                    pass
+            else:
+                personal_info = _construct_personal_info(personal_data)
         except Exception as e:
             raise ValueError(f"Failed to load personal info from {personal_info_path}: {e}")
         
         # Load keyword weights
         try:
-            with open(keyword_weights_path, 'r', encoding='utf-8') as f:
-                keyword_data = json.load(f)
+            keyword_data = _read_json_file(keyword_weights_path)
             keyword_weights = KeywordWeights(**keyword_data)
         except Exception as e:
             logger.warning("Failed to load keyword weights", file_path=str(keyword_weights_path), error=str(e))
@@ -443,178 +778,34 @@ class AppConfig(BaseModel):
     
     @staticmethod
     def _load_linkedin_selectors() -> LinkedInSelectors:
-        """Load LinkedIn selectors from the existing config.py structure."""
-        # This would typically load from a JSON file, but for now we'll use the existing structure
-        # In a real implementation, you might want to move these to a separate JSON file
-        selectors_data = {
-            "login": {
-                "username": 'input[id="username"]',
-                "password": 'input[id="password"]',
-                "submit": 'button[type="submit"]',
-            },
-            "login_fallbacks": [
-                'input[name="session_key"]',
-                'input[name="session_password"]',
-                'input[type="email"]',
-                'input[type="password"]',
-                'button:has-text("Sign in")',
-                'button:has-text("Log in")'
-            ],
-            "login_success": [
-                'nav[aria-label="Primary"]',
-                'div[data-test-id="feed-identity-module"]',
-                '.feed-shared-update-v2',
-                '.global-nav',
-                'main[role="main"]',
-                '.application-outlet'
-            ],
-            "job_search": {
-                "job_list": "div.scaffold-layout__list.jobs-semantic-search-list",
-                "total_jobs": "div.t-black--light.pv4.text-body-small.mr2",
-                "job_cards": "ul.semantic-search-results-list > li",
-                "job_wrapper": "div.job-card-job-posting-card-wrapper, div.base-card",
-            },
-            "job_detail": {
-                "title": [
-                    'h1.t-24.t-bold.inline',
-                    'h1.jobs-unified-top-card__job-title',
-                    'h1.top-card-layout__title'
-                ],
-                "company": [
-                    'div.job-details-jobs-unified-top-card__company-name a',
-                    'a.topcard__org-name-link'
-                ],
-                "location": 'span.tvm__text.tvm__text--low-emphasis',
-                "description": [
-                    'div.jobs-description__content',
-                    'div.jobs-description-content__text',
-                    'div.jobs-box__html-content',
-                    'div.jobs-unified-top-card__job-description',
-                    'div.jobs-details__main-content',
-                    'div[data-test-id="job-description"]',
-                    'div.jobs-box__html-content div',
-                    'div.jobs-description div',
-                    'div.jobs-unified-top-card__content--main div',
-                    'div.jobs-details__main-content div'
-                ],
-                "unavailable": "div.jobs-unavailable",
-            },
-            "easy_apply": {
-                "button": [
-                    'div.jobs-apply-button--top-card button.jobs-apply-button',
-                    'button[data-test-id="apply-button"]',
-                    'button:has-text("Easy Apply")',
-                    'button:has-text("Apply")',
-                    'button[aria-label*="Apply"]',
-                    'div.jobs-apply-button button',
-                    'button.jobs-apply-button'
-                ],
-                "modal": [
-                    'div.jobs-easy-apply-modal[role="dialog"]',
-                    'div.artdeco-modal.jobs-easy-apply-modal',
-                    'div[role="dialog"]',
-                    'div.artdeco-modal',
-                    'div.jobs-easy-apply-modal'
-                ],
-                "submit": [
-                    'button[aria-label="Submit application"]',
-                    'button:has-text("Submit application")',
-                    'button:has-text("Submit")',
-                    'button[data-test-id="submit-button"]'
-                ],
-                "review": [
-                    'button[aria-label="Review your application"]',
-                    'button:has-text("Review your application")',
-                    'button:has-text("Review")',
-                    'button[data-test-id="review-button"]'
-                ],
-                "next": [
-                    'button[aria-label="Continue to next step"]',
-                    'button:has-text("Continue to next step")',
-                    'button:has-text("Next")',
-                    'button:has-text("Continue")',
-                    'button[data-test-id="next-button"]'
-                ],
-                "follow_checkbox": [
-                    "input#follow-company-checkbox",
-                    "input[name='follow-company']",
-                    "input[type='checkbox'][id*='follow']"
-                ],
-                "follow_label": [
-                    "label[for='follow-company-checkbox']",
-                    "label[for*='follow']"
-                ],
-                "dismiss": [
-                    'button[aria-label="Dismiss"]',
-                    'button:has-text("Dismiss")',
-                    'button:has-text("Close")',
-                    'button[data-test-id="dismiss-button"]'
-                ],
-            },
-            "easy_apply_fallbacks": [
-                'button:has-text("Easy Apply")',
-                'button:has-text("Apply")',
-                'button[aria-label*="Apply"]',
-                'button[data-test-id*="apply"]',
-                'div[role="dialog"]',
-                'div.artdeco-modal',
-                'button:has-text("Submit")',
-                'button:has-text("Next")',
-                'button:has-text("Continue")'
-            ],
-            "resume_upload": {
-                "upload_button": 'label.jobs-document-upload__upload-button',
-                "file_input": "div.js-jobs-document-upload__container input[type='file'][id*='upload-resume']",
-            },
-            "application_status": {
-                "applied_banner": "div.post-apply-timeline__content",
-                "applied_text": "Application submitted",
-                "no_longer_accepting": [
-                    "div:has-text('No longer accepting applications')",
-                    "span:has-text('No longer accepting applications')",
-                    "p:has-text('No longer accepting applications')",
-                    "[data-test-id*='no-longer-accepting']",
-                    ".jobs-apply-button--disabled:has-text('No longer accepting')"
-                ],
-                "confirmation": [
-                    'div.jobs-apply-confirmation',
-                    'div.post-apply-timeline__content',
-                    'a[aria-label="Download your submitted resume"]',
-                    'button.jobs-apply-button[aria-label*="Applied"]'
-                ]
-            },
-            "form_fields": {
-                "radio_fieldset": "fieldset[data-test-form-builder-radio-button-form-component='true']",
-                "radio_input": "input[type='radio']",
-                "dropdown": "select.fb-dash-form-element__select-dropdown",
-                "dropdown_label": "xpath=preceding-sibling::label[1]",
-            }
-        }
-        
-        return LinkedInSelectors(**selectors_data)
+        """Load the default LinkedIn selectors (validated once per process)."""
+        return _default_linkedin_selectors()
     
     def save_personal_info(self, path: Optional[Path] = None) -> None:
         """Save personal information to YAML file."""
-        import yaml
-        
         if path is None:
             path = self.file_paths.personal_info
         
         with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.personal_info.dict(), f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                self.personal_info.cached_dump(), f,
+                Dumper=CSafeDumper, default_flow_style=False, allow_unicode=True
+            )
     
     def save_keyword_weights(self, path: Optional[Path] = None) -> None:
         """Save keyword weights to JSON file."""
-        import json
-        
         if path is None:
             path = self.file_paths.keyword_weights
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.keyword_weights.dict(), f, indent=2)
+        _write_json_file(path, self.keyword_weights.cached_dump())
     
     def validate_linkedin_credentials(self) -> bool:
-        """Validate that LinkedIn credentials are present."""
+        """
+        Validate that LinkedIn credentials are present.
+        
+        Kept for external callers; ConfigManager.validate_credentials checks its
+        cached credential properties directly.
+        """
         return bool(self.settings.linkedin_email and self.settings.linkedin_password)
     
     def get_resume_template_path(self) -> Path:
@@ -623,11 +814,9 @@ class AppConfig(BaseModel):
     
     def get_output_resume_path(self, job_title: str, company: str) -> Path:
         """Generate output resume path for a specific job."""
-        import re
-        
         # Sanitize job title and company for filename
-        safe_title = re.sub(r'[^a-zA-Z0-9_-]', '', job_title.replace(" ", "_"))
-        safe_company = re.sub(r'[^a-zA-Z0-9_-]', '', company.replace(" ", "_"))
+        safe_title = _sanitize_filename_part(job_title)
+        safe_company = _sanitize_filename_part(company)
         
         filename = f"{safe_title}_{safe_company}_resume.pdf"
         return self.file_paths.resumes_dir / filename
@@ -1,14 +1,61 @@
 # src/cookie_manager.py
 
 import json
+import logging
+import mmap
 import os
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from src.logging_config import get_logger, log_function_call, log_error_context
 
 logger = get_logger(__name__)
 
+# Project root, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Playwright cookie URLs for the LinkedIn cookie domains
+_DOMAIN_URL: Dict[str, str] = {
+    '.linkedin.com': "https://www.linkedin.com/",
+    '.www.linkedin.com': "https://www.linkedin.com/",
+}
+
+# Visible page text that signals a failed LinkedIn GraphQL request
+_GRAPHQL_ERROR_TEXT = "text=/something went wrong|try refreshing/i"
+
+# Seconds a cookies_exist() result stays valid
+_EXISTS_TTL = 0.5
+
+# Parsed cookie files keyed by path: (st_mtime_ns, st_size, cookies, min_expiry).
+# min_expiry is the earliest expiry seen when every cookie last validated, else None.
+# load_cookies hands out copies, so callers can never mutate these entries.
+_COOKIE_CACHE: Dict[str, Tuple[int, int, Tuple[dict, ...], Optional[float]]] = {}
+
+# A save of identical cookies within this many seconds of the last one is skipped
+_SAVE_COALESCE_SECONDS = 5.0
+
+# Skip revalidation only while the earliest cached expiry is at least this far off
+_EXPIRY_MARGIN = 5.0
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads_json(data: Any) -> Any:
+    """Parse JSON from a bytes-like object, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
 
 class CookieManager:
     """
@@ -17,17 +64,26 @@ class CookieManager:
     and reloads them for subsequent automated runs.
     """
     
-    def __init__(self, cookies_file: str = "linkedin_cookies.json"):
+    def __init__(self, cookies_file: str = "linkedin_cookies.json", logger: Optional[Any] = None):
         """
         Initialize the cookie manager.
         
         Args:
             cookies_file: Path to the JSON file where cookies will be stored
+            logger: Structured (structlog-style) logger; defaults to this module's logger
         """
+        self.logger = logger or get_logger(__name__)
         # Store cookies in the project root directory
-        project_root = Path(__file__).parent.parent
-        self.cookies_file = project_root / cookies_file
+        self.cookies_file = _PROJECT_ROOT / cookies_file
+        # Plain string path for os.* calls, avoiding pathlib overhead on hot paths
+        self._cookies_path_str = str(self.cookies_file)
         self.cookies: List[dict] = []
+        # (monotonic time, result) of the last existence check, reused for a short TTL
+        self._exists_cache: Optional[Tuple[float, bool]] = None
+        # Earliest expiry among the cookies kept by the last _validate_cookies call
+        self._min_expiry_seen: Optional[float] = None
+        # Monotonic time of the last successful save, used to coalesce repeated writes
+        self._last_save_monotonic: float = 0.0
         
     def save_cookies(self, cookies: List[dict]) -> bool:
         """
@@ -39,18 +95,36 @@ class CookieManager:
         Returns:
             True if successful, False otherwise
         """
+        if (time.monotonic() - self._last_save_monotonic < _SAVE_COALESCE_SECONDS
+                and cookies == self.cookies and self.cookies_exist()):
+            # The same cookies were just written (e.g. age and GraphQL refresh in one tick)
+            self.logger.debug("Skipped redundant cookie save", count=len(cookies))
+            return True
+        
         try:
-            # Save cookies to file
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            # Write to a sibling temp file and swap it in so a crash never leaves a partial file
+            tmp_file = self._cookies_path_str + '.tmp'
+            data = memoryview(_dumps_json(cookies))
+            # 0o600: the file holds a live session, keep it private to the user
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self._cookies_path_str)
+            _COOKIE_CACHE.pop(self._cookies_path_str, None)
+            self._exists_cache = (time.monotonic(), True)
+            # Snapshot, so a caller mutating its list can't make the coalesce check match
+            self.cookies = [dict(c) for c in cookies]
+            self._last_save_monotonic = time.monotonic()
             
-            logger.info(f"Saved {len(cookies)} cookies to {self.cookies_file}")
-            logger.info("Saved cookies", count=len(cookies), file_path=str(self.cookies_file))
+            self.logger.info("Saved cookies", count=len(cookies), file_path=str(self.cookies_file))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to save cookies: {e}")
-            logger.error("Failed to save cookies", error=str(e))
+            self.logger.error("Failed to save cookies", error=str(e))
             return False
     
     def load_cookies(self) -> Optional[List[dict]]:
@@ -60,21 +134,43 @@ class CookieManager:
         Returns:
             List of valid cookie dictionaries if file exists, None otherwise
         """
-        if not self.cookies_file.exists():
-            logger.debug(f"Cookie file not found: {self.cookies_file}")
+        try:
+            stat_result = os.stat(self._cookies_path_str)
+        except FileNotFoundError:
+            self.logger.debug("Cookie file not found", file_path=str(self.cookies_file))
             return None
         
         try:
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
+            cached = _COOKIE_CACHE.get(self._cookies_path_str)
+            min_expiry = None
+            if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+                # File unchanged since it was last parsed
+                cookies, min_expiry = cached[2], cached[3]
+            else:
+                if stat_result.st_size == 0:
+                    # mmap cannot map an empty file; treat it like a missing one
+                    self.logger.debug("Cookie file is empty", file_path=self._cookies_path_str)
+                    return None
+                # Parse straight from the page cache instead of copying the file into memory
+                with open(self._cookies_path_str, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    cookies = _loads_json(view)
             
-            # Validate and filter expired cookies
-            valid_cookies = self._validate_cookies(cookies)
+            if min_expiry is not None and time.time() < min_expiry - _EXPIRY_MARGIN:
+                # Every cookie was valid last time and none can have expired since
+                valid_cookies = cookies
+            else:
+                # Validate and filter expired cookies
+                valid_cookies = self._validate_cookies(cookies)
+                _COOKIE_CACHE[self._cookies_path_str] = (
+                    stat_result.st_mtime_ns, stat_result.st_size, tuple(cookies),
+                    self._min_expiry_seen if len(valid_cookies) == len(cookies) else None,
+                )
             
             if len(valid_cookies) < len(cookies):
                 expired_count = len(cookies) - len(valid_cookies)
-                logger.warning(f"Filtered out {expired_count} expired cookies")
-                logger.warning("Filtered out expired cookies", expired_count=expired_count)
+                self.logger.warning("Filtered out expired cookies", expired_count=expired_count)
                 
                 # Save cleaned cookies back to file
                 if valid_cookies:
@@ -82,23 +178,20 @@ class CookieManager:
                 else:
                     # All cookies expired, delete file
                     self.delete_cookies()
-                    logger.info("All cookies expired - deleted cookie file")
-                    logger.info("All cookies expired - deleted cookie file")
+                    self.logger.info("All cookies expired - deleted cookie file")
                     return None
             
             # Check cookie freshness (LinkedIn cookies older than 7 days may be suspicious)
             cookie_age = self._get_cookie_age(cookies)
             if cookie_age > 7 * 24 * 3600:  # 7 days in seconds
-                logger.warning(f"Cookies are {cookie_age / (24*3600):.1f} days old - may need refresh")
-                logger.warning("Cookies are old - may need refresh", age_days=cookie_age / (24*3600))
+                self.logger.warning("Cookies are old - may need refresh", age_days=cookie_age / (24*3600))
             
-            logger.info(f"Loaded {len(valid_cookies)} valid cookies from {self.cookies_file}")
-            logger.info("Loaded valid cookies", count=len(valid_cookies), file_path=str(self.cookies_file))
-            return valid_cookies
+            self.logger.info("Loaded valid cookies", count=len(valid_cookies), file_path=str(self.cookies_file))
+            # Fresh list and dicts: the parsed cookies are shared through _COOKIE_CACHE
+            return [dict(cookie) for cookie in valid_cookies]
             
         except Exception as e:
-            logger.error(f"Failed to load cookies: {e}")
-            logger.error("Failed to load cookies", error=str(e))
+            self.logger.error("Failed to load cookies", error=str(e))
             return None
     
     def _validate_cookies(self, cookies: List[dict]) -> List[dict]:
@@ -111,23 +204,25 @@ class CookieManager:
         Returns:
             List of valid (non-expired) cookies
         """
-        valid_cookies = []
-        current_time = time.time()
+        now = time.time()
+        # -1 means session cookie (expires when browser closes)
+        valid_cookies = [
+            cookie for cookie in cookies
+            if (expires := cookie.get('expires', -1)) == -1 or expires > now
+        ]
+        self._min_expiry_seen = min(
+            (c['expires'] for c in valid_cookies if c.get('expires', -1) != -1),
+            default=float('inf'),
+        )
         
-        for cookie in cookies:
-            # Check expiration
-            expires = cookie.get('expires', -1)
-            
-            # -1 means session cookie (expires when browser closes)
-            if expires == -1:
-                valid_cookies.append(cookie)
-                continue
-            
-            # Check if cookie is expired
-            if expires > current_time:
-                valid_cookies.append(cookie)
-            else:
-                logger.debug(f"Cookie '{cookie.get('name', 'unknown')}' expired")
+        # Ask the logger that will emit the record; structlog proxies may not expose isEnabledFor
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        if len(valid_cookies) < len(cookies) and (is_enabled_for is None or is_enabled_for(logging.DEBUG)):
+            valid_ids = {id(cookie) for cookie in valid_cookies}
+            self.logger.debug(
+                "Cookies expired",
+                cookie_names=[c.get('name', 'unknown') for c in cookies if id(c) not in valid_ids],
+            )
         
         return valid_cookies
     
@@ -141,12 +236,18 @@ class CookieManager:
         Returns:
             Age in seconds, or 0 if file doesn't exist
         """
-        if not self.cookies_file.exists():
+        file_mtime = self._cookie_mtime()
+        if file_mtime is None:
             return 0
-        
-        file_mtime = self.cookies_file.stat().st_mtime
         return time.time() - file_mtime
     
+    def _cookie_mtime(self) -> Optional[float]:
+        """Return the cookie file's mtime with a single stat, or None if it is missing."""
+        try:
+            return os.stat(self._cookies_path_str).st_mtime
+        except FileNotFoundError:
+            return None
+    
     def prepare_cookies_for_playwright(self, cookies: List[dict], url: str = "https://www.linkedin.com") -> List[dict]:
         """
         Prepare cookies for Playwright by ensuring required fields are present.
@@ -161,37 +262,49 @@ class CookieManager:
         prepared_cookies = []
         
         for cookie in cookies:
+            domain = cookie.get('domain', '.linkedin.com')
+            
+            # Playwright requires 'url' field when adding cookies; LinkedIn domains are precomputed
+            url_for_domain = _DOMAIN_URL.get(domain)
+            if url_for_domain is None:
+                # Generic fallback for other domains and subdomains
+                url_for_domain = f"https://www{domain[1:]}/" if domain.startswith('.') else f"https://{domain}/"
+            
             # Ensure required fields exist
-            prepared_cookie = {
+            prepared_cookies.append({
                 'name': cookie.get('name', ''),
                 'value': cookie.get('value', ''),
-                'domain': cookie.get('domain', '.linkedin.com'),
+                'domain': domain,
                 'path': cookie.get('path', '/'),
                 'expires': cookie.get('expires', -1),
                 'httpOnly': cookie.get('httpOnly', False),
                 'secure': cookie.get('secure', True),
-                'sameSite': cookie.get('sameSite', 'None')
-            }
-            
-            # Playwright requires 'url' field when adding cookies
-            # Normalize domain to ensure proper matching
-            domain = prepared_cookie['domain']
-            if domain.startswith('.'):
-                # Handle different LinkedIn domain patterns
-                if domain == '.linkedin.com':
-                    prepared_cookie['url'] = "https://www.linkedin.com/"
-                elif domain == '.www.linkedin.com':
-                    prepared_cookie['url'] = "https://www.linkedin.com/"
-                else:
-                    # Generic fallback for other subdomains
-                    prepared_cookie['url'] = f"https://www{domain[1:]}/"
-            else:
-                prepared_cookie['url'] = f"https://{domain}/"
-            
-            prepared_cookies.append(prepared_cookie)
+                'sameSite': cookie.get('sameSite', 'None'),
+                'url': url_for_domain,
+            })
         
         return prepared_cookies
     
+    def _extract_linkedin_cookies(self, context) -> List[dict]:
+        """
+        Copy the LinkedIn cookies out of a browser context in one pass.
+        
+        context.cookies(url) is not used: Playwright also matches the cookie path,
+        which would drop path-scoped LinkedIn cookies.
+        """
+        return [
+            dict(c) for c in context.cookies()
+            if 'linkedin.com' in c.get('domain', '') or 'linkedin.com' in c.get('url', '')
+        ]
+    
+    def _do_refresh(self, context) -> bool:
+        """Persist the context's current LinkedIn cookies; False if there are none."""
+        linkedin_cookies = self._extract_linkedin_cookies(context)
+        if not linkedin_cookies:
+            return False
+        self.save_cookies(linkedin_cookies)
+        return True
+    
     def refresh_cookies_if_needed(self, context, page) -> bool:
         """
         Refresh cookies if they're getting stale during a session.
@@ -206,57 +319,34 @@ class CookieManager:
         """
         try:
             # Check if cookies need refresh (after 15 minutes of use, not 30)
-            if self.cookies_file.exists():
+            file_mtime = self._cookie_mtime()
+            if file_mtime is not None:
                 # Get cookie file age
-                file_mtime = self.cookies_file.stat().st_mtime
                 cookie_age = time.time() - file_mtime
                 
                 # If cookies are old but session is still valid, refresh them
                 if cookie_age > 15 * 60:  # Reduced to 15 minutes for better session management
-                    current_cookies = context.cookies()
-                    if current_cookies:
-                        cookies_dict = [dict(c) for c in current_cookies]
-                        
-                        # Filter to only LinkedIn cookies
-                        linkedin_cookies = [
-                            c for c in cookies_dict 
-                            if 'linkedin.com' in c.get('domain', '') or 'linkedin.com' in c.get('url', '')
-                        ]
-                        
-                        if linkedin_cookies:
-                            self.save_cookies(linkedin_cookies)
-                            logger.info("Refreshed cookies during session")
-                            logger.info("Refreshed session cookies")
-                            return True
+                    if self._do_refresh(context):
+                        self.logger.info("Refreshed session cookies")
+                        return True
                             
             # Also check for GraphQL authentication issues
             try:
-                # Check if we're getting GraphQL errors by looking at page content
-                page_content = page.inner_text("body").lower()
-                if "something went wrong" in page_content or "try refreshing" in page_content:
-                    logger.warning("GraphQL error detected - refreshing cookies")
-                    logger.warning("GraphQL error detected - attempting cookie refresh")
+                # Check if we're getting GraphQL errors; the text match runs inside the browser
+                # and only counts visible messages, so the body text is never copied over
+                if page.locator(_GRAPHQL_ERROR_TEXT).first.is_visible():
+                    self.logger.warning("GraphQL error detected - attempting cookie refresh")
                     
                     # Force cookie refresh
-                    current_cookies = context.cookies()
-                    if current_cookies:
-                        cookies_dict = [dict(c) for c in current_cookies]
-                        linkedin_cookies = [
-                            c for c in cookies_dict 
-                            if 'linkedin.com' in c.get('domain', '') or 'linkedin.com' in c.get('url', '')
-                        ]
-                        
-                        if linkedin_cookies:
-                            self.save_cookies(linkedin_cookies)
-                            logger.info("Refreshed cookies due to GraphQL error")
-                            logger.info("Refreshed cookies due to GraphQL error")
-                            return True
+                    if self._do_refresh(context):
+                        self.logger.info("Refreshed cookies due to GraphQL error")
+                        return True
                             
             except Exception as e:
-                logger.debug(f"Could not check for GraphQL errors: {e}")
+                self.logger.debug("Could not check for GraphQL errors", error=str(e))
                 
         except Exception as e:
-            logger.warning(f"Failed to refresh cookies: {e}")
+            self.logger.warning("Failed to refresh cookies", error=str(e))
         
         return False
     
@@ -267,23 +357,37 @@ class CookieManager:
         Returns:
             True if successful, False otherwise
         """
+        _COOKIE_CACHE.pop(self._cookies_path_str, None)
         try:
-            if self.cookies_file.exists():
-                self.cookies_file.unlink()
-                logger.info("Deleted cookie file", file_path=str(self.cookies_file))
-                return True
-        except Exception as e:
-            logger.error(f"Failed to delete cookies: {e}")
+            # One unlink syscall; a missing file is simply nothing to delete
+            os.unlink(self._cookies_path_str)
+        except FileNotFoundError:
+            self._exists_cache = (time.monotonic(), False)
             return False
-        return False
+        except OSError as e:
+            self._exists_cache = None
+            self.logger.error("Failed to delete cookies", error=str(e))
+            return False
+        self._exists_cache = (time.monotonic(), False)
+        self.logger.info("Deleted cookie file", file_path=self._cookies_path_str)
+        return True
     
     def cookies_exist(self) -> bool:
         """
         Check if cookies file exists.
         
+        The result is reused for _EXISTS_TTL seconds so that several startup
+        checks share one stat; save_cookies and delete_cookies refresh it.
+        
         Returns:
             True if file exists, False otherwise
         """
-        return self.cookies_file.exists()
+        now = time.monotonic()
+        cached = self._exists_cache
+        if cached is not None and now - cached[0] < _EXISTS_TTL:
+            return cached[1]
+        exists = os.path.exists(self._cookies_path_str)
+        self._exists_cache = (now, exists)
+        return exists
 
 
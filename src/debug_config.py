@@ -8,157 +8,204 @@ asset rendering and reduce GraphQL-related issues.
 
 import os
 import logging
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 # Use standard logging to avoid circular import
 logger = logging.getLogger(__name__)
 
+_DEBUG_BROWSER_ARGS = (
+    # Reduce aggressive resource blocking in debug mode
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    
+    # Allow more resources for debugging
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    
+    # Enable better debugging
+    '--enable-logging',
+    '--log-level=0',
+    '--v=1',
+    
+    # Reduce memory pressure
+    '--memory-pressure-off',
+    '--max_old_space_size=4096',
+    
+    # Allow debugging tools
+    '--remote-debugging-port=9222',
+    '--disable-dev-shm-usage',
+)
+
+_DEBUG_TIMEOUTS = {
+    'page_load': 30.0,  # Increased from default
+    'element_wait': 15.0,  # Increased for GraphQL hydration
+    'network_idle': 10.0,  # Allow more time for GraphQL requests
+    'easy_apply_click': 20.0,  # Longer timeout for debug mode
+}
+
+_BASE_DELAYS = {
+    'ui_stability': 1.0,
+    'human_behavior': 0.5,
+    'page_transition': 2.0,
+    'graphql_wait': 3.0,  # Extra time for GraphQL hydration
+}
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _env_true(name: str) -> bool:
+    """Return True if the environment variable is set to 'true' (any case)."""
+    return os.environ.get(name, 'false').lower() == 'true'
+
+
+# Environment snapshot taken once at import; refresh with DebugConfig.reload()
+_DEBUG = _env_true('DEBUG')
+_REDUCE = _env_true('REDUCE_DEBUG_PAUSES')
+_SKIP = _env_true('SKIP_DEBUG_STOPS')
+_GRAPHQL_DBG = _env_true('ENABLE_GRAPHQL_DEBUG')
+
+
 class DebugConfig:
     """
     Configuration for debug mode optimizations.
     Provides settings to reduce slowdowns and improve asset rendering.
+    
+    All values are environment-derived constants, so they are built once
+    here and the methods hand back the same read-only tuple/mapping on
+    every call. Callers that need to modify a result must copy it first;
+    the module-level get_* wrappers keep returning fresh lists/dicts.
     """
     
     def __init__(self):
-        self.debug_mode = os.getenv('DEBUG', 'false').lower() == 'true'
-        self.enable_graphql_debugging = os.getenv('ENABLE_GRAPHQL_DEBUG', 'false').lower() == 'true'
-        self.reduce_debug_pauses = os.getenv('REDUCE_DEBUG_PAUSES', 'false').lower() == 'true'
+        self.debug_mode = _DEBUG
+        self.enable_graphql_debugging = _GRAPHQL_DBG
+        self.reduce_debug_pauses = _REDUCE
+        
+        self._BROWSER_ARGS: Tuple[str, ...] = _DEBUG_BROWSER_ARGS if self.debug_mode else ()
+        self._TIMEOUTS: Mapping[str, float] = (
+            MappingProxyType(dict(_DEBUG_TIMEOUTS)) if self.debug_mode else _EMPTY_MAPPING
+        )
+        # Reduce delays by 50% when REDUCE_DEBUG_PAUSES is enabled
+        delay_factor = 0.5 if self.reduce_debug_pauses else 1.0
+        self._DELAYS: Mapping[str, float] = MappingProxyType(
+            {k: v * delay_factor for k, v in _BASE_DELAYS.items()}
+        )
+        self._GRAPHQL: Mapping[str, Any] = MappingProxyType({
+            'max_retries': 3,
+            'retry_delay': 2.0,
+            'ignore_common_errors': True,
+            'log_graphql_errors': self.enable_graphql_debugging,
+            'fallback_to_static_content': True,
+        })
+        self._ROUTE: Mapping[str, Any] = MappingProxyType({
+            'block_extensions': True,
+            'block_trackers': False,  # Don't block trackers in debug mode
+            'block_images': False,   # Don't block images in debug mode
+            'allow_all_linkedin': True,  # Allow all LinkedIn resources
+            'log_blocked_requests': self.enable_graphql_debugging,
+        })
         
-    def get_debug_browser_args(self) -> list:
+    def get_debug_browser_args(self) -> Tuple[str, ...]:
         """
         Get browser arguments optimized for debug mode.
         Reduces resource blocking that can cause GraphQL issues.
         """
-        if not self.debug_mode:
-            return []
-            
-        debug_args = [
-            # Reduce aggressive resource blocking in debug mode
-            '--disable-web-security',
-            '--disable-features=VizDisplayCompositor',
-            
-            # Allow more resources for debugging
-            '--disable-background-timer-throttling',
-            '--disable-renderer-backgrounding',
-            '--disable-backgrounding-occluded-windows',
-            
-            # Enable better debugging
-            '--enable-logging',
-            '--log-level=0',
-            '--v=1',
-            
-            # Reduce memory pressure
-            '--memory-pressure-off',
-            '--max_old_space_size=4096',
-            
-            # Allow debugging tools
-            '--remote-debugging-port=9222',
-            '--disable-dev-shm-usage',
-        ]
-        
-        logger.info(f"Debug mode: Using {len(debug_args)} debug-optimized browser arguments")
-        return debug_args
+        if self._BROWSER_ARGS:
+            logger.info(f"Debug mode: Using {len(self._BROWSER_ARGS)} debug-optimized browser arguments")
+        return self._BROWSER_ARGS
     
-    def get_debug_timeouts(self) -> Dict[str, float]:
+    def get_debug_timeouts(self) -> Mapping[str, float]:
         """
         Get timeout settings optimized for debug mode.
         Longer timeouts to handle GraphQL loading issues.
         """
-        if not self.debug_mode:
-            return {}
-            
-        return {
-            'page_load': 30.0,  # Increased from default
-            'element_wait': 15.0,  # Increased for GraphQL hydration
-            'network_idle': 10.0,  # Allow more time for GraphQL requests
-            'easy_apply_click': 20.0,  # Longer timeout for debug mode
-        }
+        return self._TIMEOUTS
     
-    def get_debug_delays(self) -> Dict[str, float]:
+    def get_debug_delays(self) -> Mapping[str, float]:
         """
         Get delay settings optimized for debug mode.
         Reduced delays when REDUCE_DEBUG_PAUSES is enabled.
         """
-        base_delays = {
-            'ui_stability': 1.0,
-            'human_behavior': 0.5,
-            'page_transition': 2.0,
-            'graphql_wait': 3.0,  # Extra time for GraphQL hydration
-        }
-        
-        if self.reduce_debug_pauses:
-            # Reduce delays by 50% when REDUCE_DEBUG_PAUSES is enabled
-            return {k: v * 0.5 for k, v in base_delays.items()}
-        
-        return base_delays
+        return self._DELAYS
     
     def should_skip_debug_stops(self) -> bool:
         """
         Determine if debug stops should be skipped.
         Useful for reducing interruptions during debugging.
         """
-        return self.reduce_debug_pauses or os.getenv('SKIP_DEBUG_STOPS', 'false').lower() == 'true'
+        return _REDUCE or _SKIP
     
-    def get_graphql_error_handling(self) -> Dict[str, Any]:
+    def get_graphql_error_handling(self) -> Mapping[str, Any]:
         """
         Get GraphQL error handling configuration for debug mode.
         """
-        return {
-            'max_retries': 3,
-            'retry_delay': 2.0,
-            'ignore_common_errors': True,
-            'log_graphql_errors': self.enable_graphql_debugging,
-            'fallback_to_static_content': True,
-        }
+        return self._GRAPHQL
     
-    def get_debug_route_handling(self) -> Dict[str, Any]:
+    def get_debug_route_handling(self) -> Mapping[str, Any]:
         """
         Get route handling configuration for debug mode.
         Less aggressive blocking to prevent GraphQL issues.
         """
-        return {
-            'block_extensions': True,
-            'block_trackers': False,  # Don't block trackers in debug mode
-            'block_images': False,   # Don't block images in debug mode
-            'allow_all_linkedin': True,  # Allow all LinkedIn resources
-            'log_blocked_requests': self.enable_graphql_debugging,
-        }
+        return self._ROUTE
+    
+    @classmethod
+    def reload(cls) -> None:
+        """
+        Re-read the debug environment variables and refresh the global instance.
+        Call after changing DEBUG, REDUCE_DEBUG_PAUSES, SKIP_DEBUG_STOPS or
+        ENABLE_GRAPHQL_DEBUG at runtime (e.g. in tests).
+        """
+        global _DEBUG, _REDUCE, _SKIP, _GRAPHQL_DBG, DEBUG_MODE, REDUCE_PAUSES
+        _DEBUG = _env_true('DEBUG')
+        _REDUCE = _env_true('REDUCE_DEBUG_PAUSES')
+        _SKIP = _env_true('SKIP_DEBUG_STOPS')
+        _GRAPHQL_DBG = _env_true('ENABLE_GRAPHQL_DEBUG')
+        # Re-initialize in place so existing references see the new values
+        debug_config.__init__()
+        DEBUG_MODE = _DEBUG
+        REDUCE_PAUSES = _REDUCE
 
 # Global debug config instance
 debug_config = DebugConfig()
 
+# Plain module constants for hot paths: `from src.debug_config import DEBUG_MODE`
+DEBUG_MODE = debug_config.debug_mode
+REDUCE_PAUSES = debug_config.reduce_debug_pauses
+
 def get_debug_config() -> DebugConfig:
     """Get the global debug configuration instance."""
     return debug_config
 
 def is_debug_mode() -> bool:
-    """Check if debug mode is enabled."""
-    return debug_config.debug_mode
+    """Check if debug mode is enabled. Hot paths can read DEBUG_MODE directly."""
+    return DEBUG_MODE
 
 def should_reduce_debug_pauses() -> bool:
-    """Check if debug pauses should be reduced."""
-    return debug_config.reduce_debug_pauses
+    """Check if debug pauses should be reduced. Hot paths can read REDUCE_PAUSES directly."""
+    return REDUCE_PAUSES
 
-def get_debug_browser_args() -> list:
-    """Get debug-optimized browser arguments."""
-    return debug_config.get_debug_browser_args()
+def get_debug_browser_args() -> List[str]:
+    """Get debug-optimized browser arguments (a fresh list the caller may modify)."""
+    return list(debug_config.get_debug_browser_args())
 
 def get_debug_timeouts() -> Dict[str, float]:
-    """Get debug-optimized timeout settings."""
-    return debug_config.get_debug_timeouts()
+    """Get debug-optimized timeout settings (a fresh dict the caller may modify)."""
+    return dict(debug_config.get_debug_timeouts())
 
 def get_debug_delays() -> Dict[str, float]:
-    """Get debug-optimized delay settings."""
-    return debug_config.get_debug_delays()
+    """Get debug-optimized delay settings (a fresh dict the caller may modify)."""
+    return dict(debug_config.get_debug_delays())
 
 def should_skip_debug_stops() -> bool:
     """Check if debug stops should be skipped."""
     return debug_config.should_skip_debug_stops()
 
 def get_graphql_error_handling() -> Dict[str, Any]:
-    """Get GraphQL error handling configuration."""
-    return debug_config.get_graphql_error_handling()
+    """Get GraphQL error handling configuration (a fresh dict the caller may modify)."""
+    return dict(debug_config.get_graphql_error_handling())
 
 def get_debug_route_handling() -> Dict[str, Any]:
-    """Get debug route handling configuration."""
-    return debug_config.get_debug_route_handling()
+    """Get debug route handling configuration (a fresh dict the caller may modify)."""
+    return dict(debug_config.get_debug_route_handling())
@@ -1,18 +1,311 @@
 # src/easy_apply.py
 
-import json
-import time, random, glob, os
-import src.config as config
-from playwright.sync_api import Page
-import yaml
+import atexit
 import os
+import random
+import re
+import time
+from functools import lru_cache
+
+import yaml
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+
+import src.config as config
 from src.human_behavior import HumanBehavior
+from src.browser_config import USE_STORAGE_STATE, STORAGE_STATE_PATH
+from src.utils import remove_from_json
 from src.logging_config import get_logger, log_function_call, log_error_context, debug_pause as structlog_debug_pause, debug_stop, debug_checkpoint, debug_skip_stops
 
 logger = get_logger(__name__)
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 YAML_PATH = str(config.FILE_PATHS["personal_info"])
 
+# Footer buttons probed on every modal step, in the order they are acted on
+_FOOTER_BUTTONS = ("submit", "review", "next")
+
+# Playwright's `css:has-text("text")` split into plain CSS plus the text to match
+_HAS_TEXT_RE = re.compile(r"^(.*?):has-text\((['\"])(.*)\2\)$")
+
+# Returns, per button group, the index of the first selector matching inside a <footer>, or -1
+_PROBE_FOOTER_JS = """(groups) => {
+    const footers = Array.from(document.querySelectorAll('footer'));
+    const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const result = {};
+    for (const [name, selectors] of Object.entries(groups)) {
+        result[name] = selectors.findIndex(([css, text]) => footers.some((footer) => {
+            let els;
+            try { els = footer.querySelectorAll(css); } catch (e) { return false; }
+            return Array.from(els).some((el) => text === null || norm(el.innerText).includes(norm(text)));
+        }));
+    }
+    return result;
+}"""
+
+
+@lru_cache(maxsize=1)
+def _skip_question_re():
+    """
+    One case-insensitive alternation of QUESTION_CONFIG's skip_questions and
+    ignore_keywords, compiled on first use.
+    """
+    terms = set(config.QUESTION_CONFIG["skip_questions"]) | set(config.QUESTION_CONFIG["ignore_keywords"])
+    if not terms:
+        return re.compile(r"(?!)")  # never matches
+    # Longest first so overlapping phrases report the most specific match
+    return re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))), re.IGNORECASE)
+
+
+# State of every radio question on the step: legend text, checked value and options
+_RADIO_STATE_JS = """([fieldsetSelector, radioSelector]) => Array.from(
+    document.querySelectorAll(fieldsetSelector),
+    (fs) => {
+        const legend = fs.querySelector('legend');
+        const radios = Array.from(fs.querySelectorAll(radioSelector));
+        const checked = radios.find((r) => r.checked);
+        return {
+            question: legend ? legend.innerText.trim() : null,
+            preSelected: checked ? checked.value : null,
+            options: radios.map((r) => ({
+                value: r.value,
+                id: r.id || null,
+                hasLabel: !!r.id && !!document.querySelector(`label[for="${CSS.escape(r.id)}"]`),
+            })),
+        };
+    },
+)"""
+
+# Question, current value and option texts of every dropdown in one round-trip.
+# The label selector is resolved relative to each <select>, like dropdown.locator(sel) would.
+_DROPDOWN_STATE_JS = """(els, labelSelector) => els.map((el) => {
+    let label = null;
+    if (labelSelector.startsWith('xpath=')) {
+        label = document.evaluate(labelSelector.slice(6), el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else {
+        label = el.querySelector(labelSelector);
+    }
+    return {
+        question: label ? label.innerText.trim() : null,
+        value: el.value,
+        options: Array.from(el.options, (o) => o.innerText.trim()),
+    };
+})"""
+
+# Radio and dropdown state for the whole step in a single round-trip
+_QUESTION_STATE_JS = f"""([fieldsetSelector, radioSelector, dropdownSelector, labelSelector]) => ({{
+    radios: ({_RADIO_STATE_JS})([fieldsetSelector, radioSelector]),
+    dropdowns: ({_DROPDOWN_STATE_JS})(Array.from(document.querySelectorAll(dropdownSelector)), labelSelector),
+}})"""
+
+
+# A footer button LinkedIn marks busy while the next step loads
+_FOOTER_BUSY = 'footer button[aria-busy="true"]'
+
+# Upper bounds (ms) for the state-based waits that replace fixed sleeps
+_STEP_SETTLE_TIMEOUT = 3000
+_CONFIRMATION_TIMEOUT = 5000
+
+
+def _wait_for_footer_idle(job_page: Page) -> None:
+    """Wait until no footer button is busy, i.e. the clicked step has finished loading."""
+    try:
+        job_page.locator(_FOOTER_BUSY).first.wait_for(state="hidden", timeout=_STEP_SETTLE_TIMEOUT)
+    except PlaywrightTimeout:
+        logger.debug("Footer still busy after step transition", timeout_ms=_STEP_SETTLE_TIMEOUT)
+
+
+# Heading of the current Easy Apply step; it changes when the modal advances
+_STEP_HEADING = "h3.t-16"
+_STEP_CHANGE_TIMEOUT = 5000
+
+# Free-text fields; their labels tell apart steps that share a heading and have no radio/dropdown questions
+_TEXT_INPUT = "input[type='text'], input[type='email'], input[type='tel'], input[type='number'], input:not([type]), textarea"
+
+_STEP_CHANGED_JS = "([sel, prev]) => { const h = document.querySelector(sel); return !!h && h.innerText !== prev; }"
+
+# Everything the step walker needs in one browser-side pass: the action to take
+# (the first of submit/review/next present, with the index of its matching
+# fallback selector), the step heading, whether the resume upload field is shown,
+# the text field labels and the question state. Resolves (for wait_for_function)
+# once any footer button renders.
+_STEP_STATE_JS = f"""([groups, headingSelector, uploadSelector, textSelector, fieldsetSelector, radioSelector, dropdownSelector, labelSelector]) => {{
+    const footer = ({_PROBE_FOOTER_JS})(groups);
+    const action = Object.keys(groups).find((name) => footer[name] >= 0);
+    if (action === undefined) return null;
+    const heading = document.querySelector(headingSelector);
+    let upload = false;
+    try {{ upload = !!document.querySelector(uploadSelector); }} catch (e) {{ /* non-CSS selector */ }}
+    const textLabels = Array.from(document.querySelectorAll(textSelector), (el) => {{
+        const label = el.id ? document.querySelector(`label[for="${{CSS.escape(el.id)}}"]`) : null;
+        return label ? label.innerText.trim() : (el.getAttribute('aria-label') || el.name || '');
+    }});
+    return {{
+        action,
+        index: footer[action],
+        heading: heading ? heading.innerText : null,
+        upload,
+        textLabels,
+        questions: ({_QUESTION_STATE_JS})([fieldsetSelector, radioSelector, dropdownSelector, labelSelector]),
+    }};
+}}"""
+
+
+def _wait_for_step_change(job_page: Page, prev_heading) -> None:
+    """
+    After clicking Next/Review, return as soon as the step heading differs from
+    prev_heading instead of sleeping a fixed interval. Falls back to waiting for
+    the footer to go idle when the modal has no heading to watch.
+    """
+    if prev_heading is None:
+        _wait_for_footer_idle(job_page)
+        return
+    try:
+        job_page.wait_for_function(_STEP_CHANGED_JS, arg=[_STEP_HEADING, prev_heading], timeout=_STEP_CHANGE_TIMEOUT)
+    except PlaywrightTimeout:
+        logger.debug("Step heading did not change after click", heading=prev_heading, timeout_ms=_STEP_CHANGE_TIMEOUT)
+
+
+_UPLOAD_CONFIRM_TIMEOUT = 5000
+
+
+def _wait_for_upload(job_page: Page, resume_path: str) -> None:
+    """Return once LinkedIn lists the uploaded file by name rather than sleeping a fixed interval."""
+    try:
+        job_page.get_by_text(os.path.basename(resume_path)).first.wait_for(state="visible", timeout=_UPLOAD_CONFIRM_TIMEOUT)
+    except PlaywrightTimeout:
+        logger.debug("Uploaded resume name not shown", resume_path=resume_path, timeout_ms=_UPLOAD_CONFIRM_TIMEOUT)
+
+
+def _wait_for_confirmation(job_page: Page, timeout: float) -> bool:
+    """Wait for any submission confirmation indicator; False if none shows up in time."""
+    try:
+        job_page.wait_for_selector(_step_selectors()["confirmation"], timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+# Clears the follow-company checkbox in one round-trip; clicking fires LinkedIn's change handlers
+_UNCHECK_FOLLOW_JS = """([checkboxSelectors, labelSelectors]) => {
+    const find = (selectors) => {
+        for (const sel of selectors) {
+            try {
+                const el = document.querySelector(sel);
+                if (el) return el;
+            } catch (e) { /* skip selectors the browser can't parse */ }
+        }
+        return null;
+    };
+    const cb = find(checkboxSelectors);
+    if (!cb) return 'missing';
+    if (!cb.checked) return 'already';
+    const label = find(labelSelectors);
+    (label || cb).click();
+    if (cb.checked) cb.checked = false;
+    return 'unchecked';
+}"""
+
+
+def _ensure_follow_unchecked(job_page: Page) -> None:
+    """Make sure the 'Follow company' checkbox is cleared before submitting."""
+    try:
+        selectors = _step_selectors()
+        result = job_page.evaluate(_UNCHECK_FOLLOW_JS, [selectors["follow_checkbox"], selectors["follow_label"]])
+        if result == "unchecked":
+            logger.debug("Unchecked follow company box")
+        elif result == "already":
+            logger.debug("Follow box already unchecked")
+    except Exception as e:
+        logger.warning("Could not verify/uncheck follow box", error=str(e))
+
+
+def _as_list(selectors):
+    """Config selectors may be a single string or a list of fallbacks."""
+    return selectors if isinstance(selectors, list) else [selectors]
+
+
+def _split_selector(selector: str):
+    """Split a Playwright selector into (css, has_text or None) for use in page JS."""
+    match = _HAS_TEXT_RE.match(selector)
+    if match:
+        return (match.group(1) or "*", match.group(3))
+    return (selector, None)
+
+
+@lru_cache(maxsize=1)
+def _step_selectors() -> dict:
+    """
+    Flat view of the LINKEDIN_SELECTORS entries used on every modal step,
+    resolved on first use rather than at import so a fallback config without
+    them doesn't break importing this module.
+    """
+    selectors = config.LINKEDIN_SELECTORS
+    easy_apply, resume_upload, form_fields = selectors["easy_apply"], selectors["resume_upload"], selectors["form_fields"]
+    flat = {name: _as_list(easy_apply[name]) for name in _FOOTER_BUTTONS}
+    flat.update(
+        follow_checkbox=_as_list(easy_apply["follow_checkbox"]),
+        follow_label=_as_list(easy_apply["follow_label"]),
+        confirmation=", ".join(_as_list(selectors["application_status"]["confirmation"])),
+        upload_button=resume_upload["upload_button"],
+        file_input=resume_upload["file_input"],
+        radio_fieldset=form_fields["radio_fieldset"],
+        radio_input=form_fields["radio_input"],
+        dropdown=form_fields["dropdown"],
+        dropdown_label=form_fields["dropdown_label"],
+    )
+    return flat
+
+
+@lru_cache(maxsize=1)
+def _footer_probe_groups() -> dict:
+    """(css, has_text) pairs for each footer button's fallback selectors, built once."""
+    selectors = _step_selectors()
+    return {name: [_split_selector(sel) for sel in selectors[name]] for name in _FOOTER_BUTTONS}
+
+
+def _footer_button_locators(job_page: Page) -> dict:
+    """Build the footer button Locators once per modal so every step reuses them."""
+    footer = job_page.locator("footer")
+    selectors = _step_selectors()
+    return {name: [footer.locator(sel) for sel in selectors[name]] for name in _FOOTER_BUTTONS}
+
+
+def _read_step_state(job_page: Page):
+    """
+    Wait for the current modal step to render its footer and read its state
+    (see _STEP_STATE_JS) in one round-trip. Returns None if no Submit/Review/Next
+    button shows up within _STEP_SETTLE_TIMEOUT.
+    """
+    selectors = _step_selectors()
+    try:
+        handle = job_page.wait_for_function(_STEP_STATE_JS, arg=[
+            _footer_probe_groups(), _STEP_HEADING, selectors["upload_button"], _TEXT_INPUT,
+            selectors["radio_fieldset"], selectors["radio_input"],
+            selectors["dropdown"], selectors["dropdown_label"],
+        ], timeout=_STEP_SETTLE_TIMEOUT)
+    except PlaywrightTimeout:
+        return None
+    return handle.json_value()
+
+
+def _step_progress_key(state: dict) -> tuple:
+    """Identify a step by everything it shows; seeing the same key twice means the modal didn't advance."""
+    questions = state["questions"]
+    return (
+        state["action"],
+        state["index"],
+        state["heading"],
+        state["upload"],
+        tuple(state["textLabels"]),
+        tuple(q["question"] for q in questions["radios"]),
+        tuple(q["question"] for q in questions["dropdowns"]),
+    )
+
 def debug_pause(message: str = "", duration: float = 0) -> None:
     """
     Pause for debugging purposes. Uses structlog debug_pause.
@@ -44,98 +337,46 @@ def step_through_easy_apply(job_page: Page) -> bool:
     # Debug pause before starting Easy Apply steps
     debug_pause("About to start stepping through Easy Apply modal")
     
-    for step in range(1, 8):
-        # Debug checkpoint for each step
-        debug_checkpoint(f"easy_apply_step_{step}", step=step)
-        
-        # Debug pause for each step
-        debug_pause("Checking for buttons and form elements", step=step)
-
-        # [OK] If a resume upload section appears, handle it
-        upload_section = job_page.locator(config.LINKEDIN_SELECTORS["resume_upload"]["upload_button"])
-        if upload_section.count():
-            # Debug pause for resume upload
-            debug_pause("Resume upload section detected", step=step)
-            check_and_upload_resume(job_page)
-
-        # [OK] Handle Additional Questions (radio, dropdown, etc.)
-        # Debug pause for additional questions
-        debug_pause("About to handle additional questions", step=step)
-        handle_additional_questions(job_page)
-
-        # [OK] Footer buttons
-        footer = job_page.locator("footer")
-        submit_btn = footer.locator(config.LINKEDIN_SELECTORS["easy_apply"]["submit"])
-        review_btn = footer.locator(config.LINKEDIN_SELECTORS["easy_apply"]["review"])
-        next_btn = footer.locator(config.LINKEDIN_SELECTORS["easy_apply"]["next"])
-
-        # [SUBMIT] *** Special handling for SUBMIT step ***
-        if submit_btn.count():
-            # [OK] Uncheck "Follow company" if it exists before clicking Submit
-            follow_checkbox = job_page.locator(config.LINKEDIN_SELECTORS["easy_apply"]["follow_checkbox"])
-            if follow_checkbox.count():
-                try:
-                    if follow_checkbox.is_checked():
-                        try:
-                            logger.debug("Clicking label to uncheck follow box")
-                            job_page.locator(config.LINKEDIN_SELECTORS["easy_apply"]["follow_label"]).click()
-                        except:
-                            logger.warning("Label click failed, forcing via JS")
-                            job_page.evaluate("el => el.checked = false", follow_checkbox)
-                    else:
-                        logger.debug("Follow box already unchecked")
-                except Exception as e:
-                    logger.warning("Could not verify/uncheck follow box", error=str(e))
+    submitted = _walk_modal_steps(job_page, human_like_clicks=True)
+    if submitted:
+        _wait_for_confirmation(job_page, _CONFIRMATION_TIMEOUT)
+    return submitted
 
-            # [OK] Now submit the application
-            logger.debug("Found Submit application button", step=step)
-            
-            # Human-like hesitation before final submit
-            HumanBehavior.simulate_hesitation(0.5, 1.2)
-            HumanBehavior.human_like_click(job_page, submit_btn, move_to_element=True)
-            time.sleep(1.2)
-            logger.debug("Application submitted", step=step)
-            return True
-
-        # 🔽 *** Handle REVIEW ***
-        elif review_btn.count():
-            logger.debug("Found Review your application button", step=step)
-            HumanBehavior.simulate_hesitation(0.3, 0.7)
-            HumanBehavior.human_like_click(job_page, review_btn, move_to_element=True)
-            time.sleep(1)
-            continue
-
-        # 🔽 *** Handle NEXT ***
-        elif next_btn.count():
-            logger.debug("Found Next button", step=step)
-            HumanBehavior.simulate_hesitation(0.2, 0.6)
-            HumanBehavior.human_like_click(job_page, next_btn, move_to_element=True)
-            time.sleep(1)
-            continue
-
-        else:
-            if config.DEBUG:
-                logger.debug("No Next/Review/Submit button found", step=step)
-            break
 
-    return False
+# --------------------------
+# YAML Helpers
+# --------------------------
+# Parsed personal_info.yaml, keyed by the file's (st_mtime_ns, st_size); None if missing.
+# "dirty" marks answers recorded in memory that haven't been written yet.
+_YAML_CACHE = {"mtime": None, "data": None, "dirty": False}
 
-# src/easy_apply.py
 
-import time, random, glob, os, yaml
-import src.config as config
-from playwright.sync_api import Page
+def _yaml_file_key():
+    """Return (st_mtime_ns, st_size) for YAML_PATH, or None if it doesn't exist."""
+    try:
+        st = os.stat(YAML_PATH)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
-YAML_PATH = "personal_info.yaml"
 
-# --------------------------
-# YAML Helpers
-# --------------------------
 def load_personal_info():
-    """Load or initialize the YAML with a guaranteed 'questions' section."""
-    if os.path.exists(YAML_PATH):
+    """
+    Load or initialize the YAML with a guaranteed 'questions' section.
+    The parsed dict is cached and only re-read when the file changes on disk,
+    so callers share it and should treat it as read-only.
+    """
+    # Unsaved answers win over the file on disk
+    if _YAML_CACHE["dirty"]:
+        return _YAML_CACHE["data"]
+
+    key = _yaml_file_key()
+    if _YAML_CACHE["data"] is not None and _YAML_CACHE["mtime"] == key:
+        return _YAML_CACHE["data"]
+
+    if key is not None:
         with open(YAML_PATH, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
     else:
         data = {}
 
@@ -143,6 +384,7 @@ def load_personal_info():
     if "questions" not in data:
         data["questions"] = {}
 
+    _YAML_CACHE["mtime"], _YAML_CACHE["data"] = key, data
     return data
 
 
@@ -151,56 +393,104 @@ def save_personal_info(data):
     if "questions" not in data:
         data["questions"] = {}  # safety net
     with open(YAML_PATH, "w") as f:
-        yaml.safe_dump(data, f)
+        yaml.dump(data, f, Dumper=_YamlDumper)
+    _YAML_CACHE["mtime"], _YAML_CACHE["data"] = _yaml_file_key(), data
+    _YAML_CACHE["dirty"] = False
 
 
 def save_answer_to_yaml(question: str, answer: str):
-    """Save an answered question into YAML."""
+    """
+    Record an answered question in the cached YAML data.
+    The file is written once by flush_personal_info() rather than per answer.
+    """
     data = load_personal_info()
-    if "questions" not in data:
-        data["questions"] = {}
     data["questions"][question] = answer
-    save_personal_info(data)
+    _YAML_CACHE["dirty"] = True
+
+
+def flush_personal_info():
+    """Write answers recorded by save_answer_to_yaml() to disk, if any."""
+    if _YAML_CACHE["dirty"]:
+        save_personal_info(_YAML_CACHE["data"])
+
+
+atexit.register(flush_personal_info)
 
 # --------------------------
 # Answer Logic
 # --------------------------
+# Keyword rules in priority order; each alternative is a lookahead over the whole
+# question, so the first *rule* that matches wins regardless of keyword position
+_ANSWER_RULES = re.compile(
+    r"(?=.*?(?P<no1>sponsorship))"
+    r"|(?=.*?(?P<yes1>work in an onsite|work onsite))"
+    r"|(?=.*?(?P<yes2>relocate))"
+    r"|(?=.*?(?P<yes3>authorized to work))"
+    r"|(?=.*?(?P<yes4>years of experience))"
+    r"|(?=.*?(?P<yes5>background check))"
+    r"|(?=.*?(?P<no2>convicted))",
+    re.IGNORECASE | re.DOTALL,
+)
+_RULE_ANSWERS = {
+    "no1": "No", "yes1": "Yes", "yes2": "Yes", "yes3": "Yes",
+    "yes4": "Yes", "yes5": "Yes", "no2": "No",
+}
+
+
+@lru_cache(maxsize=4096)
 def determine_answer(question: str) -> str:
     """
     Basic keyword-based logic to infer a safe & intelligent default answer.
+    Memoized, since the same questions recur across most forms in a run.
     """
-    q_lower = question.lower()
-
-    if "sponsorship" in q_lower:
-        return "No"
-    if "work in an onsite" in q_lower or "work onsite" in q_lower:
-        return "Yes"
-    if "relocate" in q_lower:
-        return "Yes"
-    if "authorized to work" in q_lower:
-        return "Yes"
-    if "years of experience" in q_lower:
-        return "Yes"
-    if "background check" in q_lower:
-        return "Yes"
-    if "convicted" in q_lower:
-        return "No"
-
-    return "Yes"  # fallback default
+    match = _ANSWER_RULES.match(question)
+    return _RULE_ANSWERS[match.lastgroup] if match else "Yes"  # fallback default
 
 # --------------------------
 # Resume Upload
 # --------------------------
-def check_and_upload_resume(job_page):
+# Newest resume, keyed by the resumes directory and its st_mtime_ns
+_RESUME_CACHE = {"dir": None, "dir_mtime": None, "path": None}
+
+
+def _latest_resume(resume_dir: str):
+    """
+    Return the newest Borgese_*.pdf in resume_dir, or None if there is none.
+    The directory is only rescanned when its mtime changes (a file was added,
+    removed or renamed).
+    """
+    try:
+        dir_mtime = os.stat(resume_dir).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _RESUME_CACHE["dir"] == resume_dir and _RESUME_CACHE["dir_mtime"] == dir_mtime:
+        return _RESUME_CACHE["path"]
+
+    # One scandir pass; DirEntry.stat() reuses the directory read where the OS allows
+    latest, latest_mtime = None, -1.0
+    with os.scandir(resume_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("Borgese_") and entry.name.endswith(".pdf"):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+    _RESUME_CACHE.update(dir=resume_dir, dir_mtime=dir_mtime, path=latest)
+    return latest
+
+
+def check_and_upload_resume(job_page) -> bool:
     """
     Upload the most recent generated resume if an upload section is present.
     Only targets the resume upload field (ignores cover letter).
+
+    Returns:
+        True if a resume was uploaded on this step, False otherwise
     """
-    upload_button = job_page.locator(config.LINKEDIN_SELECTORS["resume_upload"]["upload_button"])
+    upload_button = job_page.locator(_step_selectors()["upload_button"])
     if not upload_button.count():
         if config.DEBUG:
             logger.debug("No Upload resume button on this step")
-        return
+        return False
 
     logger.info("Upload resume button detected - uploading resume")
     
@@ -208,62 +498,83 @@ def check_and_upload_resume(job_page):
         debug_pause("Resume upload button detected, preparing to upload...", 0.3)
 
     # [OK] Only select the resume upload field, not the cover letter
-    file_input = job_page.locator(config.LINKEDIN_SELECTORS["resume_upload"]["file_input"])
+    file_input = job_page.locator(_step_selectors()["file_input"])
 
-    if file_input.count() != 1:
-        logger.error("Found unexpected number of resume inputs", count=file_input.count(), expected=1)
-        return
+    input_count = file_input.count()
+    if input_count != 1:
+        logger.error("Found unexpected number of resume inputs", count=input_count, expected=1)
+        return False
 
     # [OK] Find the newest resume file
-    resume_dir = str(config.FILE_PATHS["resumes_dir"])
-    resume_files = glob.glob(os.path.join(resume_dir, "Borgese_*.pdf"))
-    if not resume_files:
+    latest_resume = _latest_resume(str(config.FILE_PATHS["resumes_dir"]))
+    if latest_resume is None:
         logger.error("No resume files found in output/resumes")
-        return
-
-    latest_resume = max(resume_files, key=os.path.getmtime)
+        return False
     
     if config.DEBUG:
         logger.debug("Uploading resume", resume_path=latest_resume)
 
     # [OK] Upload to LinkedIn resume field
     file_input.set_input_files(latest_resume)
+    _wait_for_upload(job_page, latest_resume)
 
     logger.info("Resume uploaded", resume_path=latest_resume)
-    debug_pause("Resume uploaded, waiting for confirmation...", 2.0)
+    debug_pause("Resume uploaded, continuing...", 0.5)
+    return True
 
 
 # --------------------------
 # Additional Questions (Radio + Dropdown)
 # --------------------------
-def handle_additional_questions(job_page):
+def handle_additional_questions(job_page, questions=None):
     """
     Detect and intelligently answer both radio button and dropdown questions.
     Answers are stored in personal_info.yaml for re-use.
+
+    Args:
+        questions: Question state already read by _STEP_STATE_JS; read from the
+            page when None
     """
+    selectors = _step_selectors()
+    if questions is None:
+        # One round-trip for every radio and dropdown question on the step
+        try:
+            questions = job_page.evaluate(_QUESTION_STATE_JS, [
+                selectors["radio_fieldset"], selectors["radio_input"],
+                selectors["dropdown"], selectors["dropdown_label"],
+            ])
+        except Exception as e:
+            if config.DEBUG:
+                print(f"[DEBUG] Error reading question fields: {e}")
+            logger.warning("Could not read question fields", error=str(e))
+            return
+    radio_questions, dropdown_questions = questions["radios"], questions["dropdowns"]
+
+    # Review/Submit steps have no questions; skip the YAML entirely
+    if not radio_questions and not dropdown_questions:
+        return
+
     data = load_personal_info()
+    # New answers are collected in `data` and written once after both loops
+    dirty = False
 
     # --- RADIO QUESTIONS ---
     try:
-        radio_fieldsets = job_page.locator(config.LINKEDIN_SELECTORS["form_fields"]["radio_fieldset"])
         if config.DEBUG:
-            logger.debug("Found radio fieldsets", count=radio_fieldsets.count())
-            if radio_fieldsets.count() > 0:
-                debug_pause(f"Processing {radio_fieldsets.count()} radio questions...", 0.2)
+            logger.debug("Found radio fieldsets", count=len(radio_questions))
+            if radio_questions:
+                debug_pause(f"Processing {len(radio_questions)} radio questions...", 0.2)
         
-        for fieldset in radio_fieldsets.all():
+        for fieldset in radio_questions:
+            question_text = fieldset["question"]
             try:
-                # Get the question text from the legend
-                question_text = fieldset.locator("legend").inner_text().strip()
+                if question_text is None:
+                    logger.warning("Radio fieldset has no legend - skipping")
+                    continue
                 saved_answer = data["questions"].get(question_text)
 
                 # [OK] 1. Check if LinkedIn already pre-filled an answer
-                pre_selected = None
-                radio_inputs = fieldset.locator(config.LINKEDIN_SELECTORS["form_fields"]["radio_input"])
-                for i in range(radio_inputs.count()):
-                    if radio_inputs.nth(i).is_checked():
-                        pre_selected = radio_inputs.nth(i).get_attribute("value")
-                        break
+                pre_selected = fieldset["preSelected"]
 
                 if pre_selected:
                     logger.info("Question already answered", question=question_text, answer=pre_selected)
@@ -275,19 +586,19 @@ def handle_additional_questions(job_page):
                     continue
 
                 # [OK] Find the radio input that matches the saved answer
-                radio_input = fieldset.locator(f"input[type='radio'][value='{saved_answer}']")
-                if not radio_input.count():
+                radio_option = next((opt for opt in fieldset["options"] if opt["value"] == str(saved_answer)), None)
+                if radio_option is None:
                     logger.warning("Could not find radio option", question=question_text, answer=saved_answer)
                     continue
 
                 # [OK] Get the label tied to this radio
-                radio_id = radio_input.get_attribute("id")
+                radio_id = radio_option["id"]
                 if not radio_id:
                     logger.warning("Radio input missing ID", question=question_text)
                     continue
 
-                label = job_page.locator(f"label[for='{radio_id}']")
-                if label.count():
+                if radio_option["hasLabel"]:
+                    label = job_page.locator(f"label[for='{radio_id}']")
                     try:
                         # Simulate reading the question before answering
                         HumanBehavior.simulate_reading(question_text, min_time=0.3, max_time=1.5)
@@ -297,12 +608,11 @@ def handle_additional_questions(job_page):
                         logger.info("Selected radio option", question=question_text, answer=saved_answer)
                     except Exception as e:
                         logger.warning("Human-like click failed for radio option", question=question_text, answer=saved_answer, error=str(e))
-                        label.scroll_into_view_if_needed()
-                        time.sleep(config.DELAYS["ui_stability"])
+                        # click() already scrolls into view and waits for the label to be stable
                         try:
                             label.click(timeout=config.TIMEOUTS["radio_click"])
                         except:
-                            job_page.evaluate("el => el.click()", label)
+                            label.evaluate("el => el.click()")
                         logger.info("Fallback click successful for radio option", question=question_text, answer=saved_answer)
                 else:
                     logger.warning("No label found for radio option", question=question_text, answer=saved_answer)
@@ -310,8 +620,7 @@ def handle_additional_questions(job_page):
             except Exception as e:
                 if config.DEBUG:
                     print(f"[DEBUG] Radio handling failed for a question: {e}")
-                    print(f"[DEBUG] Fieldset type: {type(fieldset)}")
-                    print(f"[DEBUG] Fieldset value: {fieldset}")
+                    print(f"[DEBUG] Fieldset state: {fieldset}")
                 logger.error("Radio handling failed for question", question=question_text, error=str(e))
     except Exception as e:
         if config.DEBUG:
@@ -320,41 +629,35 @@ def handle_additional_questions(job_page):
 
     # --- DROPDOWN QUESTIONS ---
     try:
-        dropdowns = job_page.locator(config.LINKEDIN_SELECTORS["form_fields"]["dropdown"])
+        dropdowns = job_page.locator(selectors["dropdown"])
         if config.DEBUG:
-            logger.debug("Found dropdowns", count=dropdowns.count())
-            if dropdowns.count() > 0:
-                debug_pause(f"Processing {dropdowns.count()} dropdown questions...", 0.2)
-        ignore_keywords = config.QUESTION_CONFIG["ignore_keywords"]
-        SKIP_QUESTIONS = config.QUESTION_CONFIG["skip_questions"]
-        for i in range(dropdowns.count()):
-            dropdown = dropdowns.nth(i)
-
-            # Extract question text (label preceding the select)
-            label_locator = dropdown.locator(config.LINKEDIN_SELECTORS["form_fields"]["dropdown_label"])
-            question_text = label_locator.inner_text().strip() if label_locator.count() else "Unknown question"
+            logger.debug("Found dropdowns", count=len(dropdown_questions))
+            if dropdown_questions:
+                debug_pause(f"Processing {len(dropdown_questions)} dropdown questions...", 0.2)
+        skip_re = _skip_question_re()
+        for i, state in enumerate(dropdown_questions):
+            question_text = state["question"] or "Unknown question"
 
             # [OK] Skip pre-filled LinkedIn profile fields
-            if any(skip in question_text for skip in SKIP_QUESTIONS):
-                if config.DEBUG:
-                    print(f"[DEBUG] ⏭️ Skipping '{question_text}'  LinkedIn profile field.")
-                continue
-            
-            if any(word in question_text for word in ignore_keywords):
+            if skip_re.search(question_text):
                 logger.info("Skipping LinkedIn profile field", question=question_text)
                 continue
 
-            selected_value = dropdowns.nth(i).input_value()
+            selected_value = state["value"]
             if selected_value and selected_value != "Select an option":
                 if config.DEBUG:
                     logger.info("Dropdown question already has value", question=question_text, value=selected_value)
                 continue
 
+            # Only dropdowns that still need an answer get a locator
+            dropdown = dropdowns.nth(i)
+
             # Use saved or new answer
             saved_answer = data["questions"].get(question_text)
             if not saved_answer:
                 saved_answer = determine_answer(question_text)
-                save_answer_to_yaml(question_text, saved_answer)
+                data["questions"][question_text] = saved_answer
+                dirty = True
                 logger.info("Determined answer for dropdown question", question=question_text, answer=saved_answer)
             else:
                 if config.DEBUG:
@@ -380,23 +683,163 @@ def handle_additional_questions(job_page):
                 HumanBehavior.simulate_hesitation(0.1, 0.3)  # Pause after selection
                 logger.info("Dropdown question answered", question=question_text, answer=saved_answer)
             except Exception as e:
-                # Try to print available options if possible
-                try:
-                    options = dropdown.locator("option")
-                    option_texts = [options.nth(j).inner_text().strip() for j in range(options.count())]
-                    logger.warning("Could not select dropdown option", question=question_text, answer=saved_answer, error=str(e))
-                    print(f"[WARN] [WARN] Available options for '{question_text}': {option_texts}")
-                except Exception as opt_e:
-                    logger.warning("Could not select dropdown option", question=question_text, answer=saved_answer, error=str(e))
-                    print(f"[WARN] [WARN] Also failed to retrieve options: {opt_e}")
+                logger.warning("Could not select dropdown option", question=question_text, answer=saved_answer, error=str(e))
+                print(f"[WARN] [WARN] Available options for '{question_text}': {state['options']}")
     except Exception as e:
         if config.DEBUG:
             print(f"[DEBUG] Error processing dropdowns: {e}")
         logger.warning("Could not process dropdowns", error=str(e))
 
+    if dirty or _YAML_CACHE["dirty"]:
+        save_personal_info(data)
+
+# --------------------------
+# Browser storage state
+# --------------------------
+# job_page must come from a context created by EnhancedBrowserConfig, which loads
+# STORAGE_STATE_PATH when USE_STORAGE_STATE is set; it is saved once per run
+_storage_state_saved = False
+
+
+def _save_storage_state_once(job_page: Page) -> None:
+    """Persist the logged-in browser state after the first successful application."""
+    global _storage_state_saved
+    if not USE_STORAGE_STATE or _storage_state_saved:
+        return
+    try:
+        job_page.context.storage_state(path=str(STORAGE_STATE_PATH))
+        # Holds live session cookies; keep it private to the user
+        os.chmod(STORAGE_STATE_PATH, 0o600)
+        _storage_state_saved = True
+        logger.info("Saved browser storage state", file_path=str(STORAGE_STATE_PATH))
+    except Exception as e:
+        logger.warning("Could not save browser storage state", error=str(e))
+
+
 # --------------------------
 # Main Easy Apply Flow
 # --------------------------
+# Human-like hesitation (min, max seconds) before clicking each footer button
+_STEP_HESITATION = {"submit": (0.5, 1.2), "review": (0.3, 0.7), "next": (0.2, 0.6)}
+
+
+def _click_step_button(job_page: Page, button, human_like_clicks: bool, hesitation: tuple) -> None:
+    """Click a footer button, either directly or with human-like hesitation and movement."""
+    if human_like_clicks:
+        HumanBehavior.simulate_hesitation(*hesitation)
+        HumanBehavior.human_like_click(job_page, button, move_to_element=True)
+    else:
+        button.first.click()
+
+
+def _walk_modal_steps(job_page: Page, *, job_url: str = "", human_like_clicks: bool = False) -> bool:
+    """
+    Walk the Easy Apply modal one step at a time. Each step's state is read in
+    a single browser-side pass (_read_step_state); the resume is uploaded and
+    radio/dropdown questions answered when the state shows them, then the
+    step's action (Submit, Review or Next) is clicked.
+
+    The walk stops when a step repeats exactly (same action, heading, upload
+    field, text fields and questions), i.e. the last click didn't move the
+    modal forward. As a backstop against a modal that keeps changing without
+    ever reaching Submit, it also stops after three times
+    RETRY_CONFIG["max_steps"] steps.
+
+    Args:
+        job_url: Only used in debug output
+        human_like_clicks: Hesitate and move the mouse before each click
+
+    Returns:
+        True once Submit was clicked, False if no footer button was found,
+        the modal stopped advancing or the step backstop was reached
+    """
+    # Locators are lazy, so build them once and re-query them on each step
+    footer_buttons = _footer_button_locators(job_page)
+    # The upload field appears on at most one step
+    resume_uploaded = False
+    seen_steps = set()
+    step_limit = config.RETRY_CONFIG["max_steps"] * 3
+    step = 0
+
+    while step < step_limit:
+        step += 1
+        # Debug checkpoint for each step
+        debug_checkpoint(f"processing_step_{step}", step=step)
+        
+        if config.DEBUG:
+            logger.debug("Step processing", step=step)
+
+        try:
+            state = _read_step_state(job_page)
+            if state is None:
+                print(f"[DEBUG] [WARN] No Next/Review/Submit button at step {step}. Stopping.")
+                debug_pause("No buttons found, stopping...", 0.5)
+                return False
+
+            progress_key = _step_progress_key(state)
+            if progress_key in seen_steps:
+                logger.warning("Easy Apply modal stopped advancing", step=step, heading=state["heading"])
+                debug_pause("Modal did not advance, stopping...", 0.5)
+                return False
+            seen_steps.add(progress_key)
+
+            # Handle resume upload (until it succeeds)
+            if state["upload"] and not resume_uploaded:
+                resume_uploaded = check_and_upload_resume(job_page)
+            
+            # Pause after resume upload check
+            if config.DEBUG:
+                debug_pause(f"After resume upload check (step {step})...", 0.3)
+
+            # Handle radio & dropdown questions from the state already read
+            handle_additional_questions(job_page, questions=state["questions"])
+            
+            # Pause after processing questions
+            if config.DEBUG:
+                debug_pause(f"After processing questions (step {step})...", 0.3)
+
+            action = state["action"]
+            button = footer_buttons[action][state["index"]]
+            
+        except Exception as step_error:
+            if config.DEBUG:
+                print("\n" + "="*80)
+                print(f"[DEBUG] 🛑 STOPPING FOR DEBUG INSPECTION - Step processing error")
+                print("="*80)
+                print(f"[DEBUG] Error: {step_error}")
+                print(f"[DEBUG] Step: {step}")
+                print(f"[DEBUG] Job URL: {job_url}")
+                print(f"[DEBUG] Current page URL: {job_page.url}")
+                print("[DEBUG] Browser will remain open for inspection.")
+                print("[DEBUG] Press Enter in terminal to continue...")
+                print("="*80 + "\n")
+                try:
+                    input()  # Wait for user input in debug mode
+                except (EOFError, KeyboardInterrupt):
+                    print("[DEBUG] Continuing automatically...")
+            raise  # Re-raise to be caught by the caller
+
+        if config.DEBUG:
+            print(f"[DEBUG] About to click {action.upper()}")
+            debug_pause(f"About to click {action.upper()} button...", 0.5)
+
+        if action == "submit":
+            # [OK] Make sure "Follow company" is unchecked
+            _ensure_follow_unchecked(job_page)
+            _click_step_button(job_page, button, human_like_clicks, _STEP_HESITATION[action])
+            logger.info("Submitted application", step=step)
+            debug_pause("Submit button clicked, waiting for confirmation...", 1.0)
+            return True
+
+        _click_step_button(job_page, button, human_like_clicks, _STEP_HESITATION[action])
+        _wait_for_step_change(job_page, state["heading"])
+        logger.info(f"Clicked {action.capitalize()} button", step=step)
+        debug_pause(f"{action.capitalize()} button clicked, continuing...", 0.8)
+
+    logger.warning("Easy Apply step limit reached without submitting", step_limit=step_limit)
+    return False
+
+
 def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
     """
     Automates LinkedIn's Easy Apply process:
@@ -426,21 +869,6 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
     if config.DEBUG:
         logger.debug("About to start Easy Apply process", resume_path=resume_path, job_url=job_url)
 
-    def remove_from_json(url: str):
-        """Removes a job URL from job_urls.json so it doesn't get retried."""
-        try:
-            if not os.path.exists("job_urls.json"):
-                return
-            with open("job_urls.json", "r") as f:
-                urls = json.load(f)
-            if url in urls:
-                urls.remove(url)
-                with open("job_urls.json", "w") as f:
-                    json.dump(urls, f, indent=2)
-                logger.info("Removed job URL from job_urls.json", url=url)
-        except Exception as e:
-            logger.warning("Could not remove job URL from job_urls.json", url=url, error=str(e))
-
     try:
         # [OK] Check if the job was already applied for
         applied_banner = job_page.locator(config.LINKEDIN_SELECTORS["application_status"]["applied_banner"])
@@ -460,9 +888,9 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
                 remove_from_json(job_url)
                 return False
         
-        # Also check the page text content for the phrase
-        page_text = job_page.inner_text("body").lower()
-        if "no longer accepting applications" in page_text:
+        # Also check the page text for the phrase; matched in the browser
+        # (case-insensitive substring) so the body text isn't pulled over
+        if job_page.get_by_text("no longer accepting applications").count():
             logger.info("Job is no longer accepting applications - skipping and removing from list")
             remove_from_json(job_url)
             return False
@@ -498,17 +926,19 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
                       button_found=True,
                       current_url=job_page.url)
         
-        # Human-like interaction with Easy Apply button
-        easy_apply_button.scroll_into_view_if_needed()
-        HumanBehavior.simulate_hesitation(0.3, 0.8)  # Pause to "read" button
-        
-        # Random mouse movement before clicking
-        try:
-            bbox = easy_apply_button.bounding_box()
-            if bbox:
-                HumanBehavior.random_mouse_movement(job_page, bbox)
-        except:
-            pass
+        # Human-like interaction with Easy Apply button; the clicks below scroll it
+        # into view themselves, so it only needs an explicit scroll for the mouse path
+        if config.HUMANIZE:
+            easy_apply_button.scroll_into_view_if_needed()
+            HumanBehavior.simulate_hesitation(0.3, 0.8)  # Pause to "read" button
+            
+            # Random mouse movement before clicking
+            try:
+                bbox = easy_apply_button.bounding_box()
+                if bbox:
+                    HumanBehavior.random_mouse_movement(job_page, bbox)
+            except:
+                pass
         
         # Human-like hover and click
         try:
@@ -517,8 +947,7 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
                 logger.debug("Human-like click on Easy Apply button")
         except Exception as e:
             logger.warning("Human-like click failed, using fallback", error=str(e))
-            easy_apply_button.hover()
-            time.sleep(random.uniform(0.2, 0.5))
+            # The modal wait below already covers settling; no extra pre-click sleep
             easy_apply_button.click(timeout=config.TIMEOUTS["easy_apply_click"])
         
         logger.info("Easy Apply button clicked")
@@ -548,172 +977,12 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
         debug_pause("Easy Apply modal detected, ready to process steps...", 0.5)
 
         # [OK] Iterate through modal steps
-        step_counter = 1
-        max_steps = config.RETRY_CONFIG["max_steps"]  # Safeguard against infinite loops
-        
         # Debug checkpoint before step iteration
         debug_checkpoint("starting_step_iteration", 
-                        max_steps=max_steps,
                         current_url=job_page.url)
         
-        while step_counter <= max_steps:
-            # Debug checkpoint for each step
-            debug_checkpoint(f"processing_step_{step_counter}", 
-                           step=step_counter, 
-                           max_steps=max_steps)
-            
-            if config.DEBUG:
-                logger.debug("Step processing", step=step_counter, max_steps=max_steps)
-
-            try:
-                # Handle resume upload (every step)
-                check_and_upload_resume(job_page)
-                
-                # Pause after resume upload check
-                if config.DEBUG:
-                    debug_pause(f"After resume upload check (step {step_counter})...", 0.3)
-
-                # Handle radio & dropdown questions
-                handle_additional_questions(job_page)
-                
-                # Pause after processing questions
-                if config.DEBUG:
-                    debug_pause(f"After processing questions (step {step_counter})...", 0.3)
-
-                # [OK] Footer buttons
-                footer = job_page.locator("footer")
-                
-                # Handle submit button (which is a list of selectors)
-                submit_selectors = config.LINKEDIN_SELECTORS["easy_apply"]["submit"]
-                submit_selectors_list = submit_selectors if isinstance(submit_selectors, list) else [submit_selectors]
-                submit_btn = None
-                for selector in submit_selectors_list:
-                    btn = footer.locator(selector)
-                    if btn.count() > 0:
-                        submit_btn = btn
-                        break
-                
-                # Handle review button (which is a list of selectors)
-                review_selectors = config.LINKEDIN_SELECTORS["easy_apply"]["review"]
-                review_selectors_list = review_selectors if isinstance(review_selectors, list) else [review_selectors]
-                review_btn = None
-                for selector in review_selectors_list:
-                    btn = footer.locator(selector)
-                    if btn.count() > 0:
-                        review_btn = btn
-                        break
-                
-                # Handle next button (which is a list of selectors)
-                next_selectors = config.LINKEDIN_SELECTORS["easy_apply"]["next"]
-                next_selectors_list = next_selectors if isinstance(next_selectors, list) else [next_selectors]
-                next_btn = None
-                for selector in next_selectors_list:
-                    btn = footer.locator(selector)
-                    if btn.count() > 0:
-                        next_btn = btn
-                        break
-                
-                # Pause before checking buttons
-                if config.DEBUG:
-                    debug_pause(f"Checking for buttons (step {step_counter})...", 0.2)
-                
-            except Exception as step_error:
-                if config.DEBUG:
-                    print("\n" + "="*80)
-                    print(f"[DEBUG] 🛑 STOPPING FOR DEBUG INSPECTION - Step processing error")
-                    print("="*80)
-                    print(f"[DEBUG] Error: {step_error}")
-                    print(f"[DEBUG] Step: {step_counter}/{max_steps}")
-                    print(f"[DEBUG] Job URL: {job_url}")
-                    print(f"[DEBUG] Current page URL: {job_page.url}")
-                    print("[DEBUG] Browser will remain open for inspection.")
-                    print("[DEBUG] Press Enter in terminal to continue...")
-                    print("="*80 + "\n")
-                    try:
-                        input()  # Wait for user input in debug mode
-                    except (EOFError, KeyboardInterrupt):
-                        print("[DEBUG] Continuing automatically...")
-                raise  # Re-raise to be caught by outer exception handler
-
-            if submit_btn and submit_btn.count() > 0:
-                # [OK] Make sure "Follow company" is unchecked
-                follow_checkbox_selectors = config.LINKEDIN_SELECTORS["easy_apply"]["follow_checkbox"]
-                follow_checkbox_selectors_list = follow_checkbox_selectors if isinstance(follow_checkbox_selectors, list) else [follow_checkbox_selectors]
-                
-                follow_checkbox = None
-                for selector in follow_checkbox_selectors_list:
-                    cb = job_page.locator(selector)
-                    if cb.count() > 0:
-                        follow_checkbox = cb
-                        break
-                
-                if follow_checkbox and follow_checkbox.count() > 0:
-                    try:
-                        if follow_checkbox.is_checked():
-                            try:
-                                logger.debug("Clicking label to uncheck follow box")
-                                follow_label_selectors = config.LINKEDIN_SELECTORS["easy_apply"]["follow_label"]
-                                follow_label_selectors_list = follow_label_selectors if isinstance(follow_label_selectors, list) else [follow_label_selectors]
-                                
-                                label_clicked = False
-                                for label_selector in follow_label_selectors_list:
-                                    try:
-                                        label = job_page.locator(label_selector)
-                                        if label.count() > 0:
-                                            label.click()
-                                            label_clicked = True
-                                            break
-                                    except:
-                                        continue
-                                
-                                if not label_clicked:
-                                    logger.warning("Label click failed, forcing via JS")
-                                    job_page.evaluate("el => el.checked = false", follow_checkbox.first)
-                            except Exception as e:
-                                print(f"[WARN] [WARN] Could not uncheck follow box: {e}")
-                                job_page.evaluate("el => el.checked = false", follow_checkbox.first)
-                        else:
-                            logger.debug("Follow box already unchecked")
-                    except Exception as e:
-                        logger.warning("Could not verify/uncheck follow box", error=str(e))
-
-                if config.DEBUG:
-                    print("[DEBUG] About to click SUBMIT")
-                    debug_pause("About to click SUBMIT button...", 0.5)
-                submit_btn.first.click()
-                logger.info("Submitted application")
-                debug_pause("Submit button clicked, waiting for confirmation...", 1.0)
-                break
-
-            elif review_btn and review_btn.count() > 0:
-                if config.DEBUG:
-                    print("[DEBUG] About to click REVIEW")
-                    debug_pause("About to click REVIEW button...", 0.5)
-                review_btn.first.click()
-                logger.info("Clicked Review button")
-                debug_pause("Review button clicked, continuing...", 0.8)
-            elif next_btn and next_btn.count() > 0:
-                if config.DEBUG:
-                    print("[DEBUG] About to click NEXT")
-                    debug_pause("About to click NEXT button...", 0.5)
-                next_btn.first.click()
-                logger.info("Clicked Next button", step=step_counter, max_steps=max_steps)
-                debug_pause("Next button clicked, moving to next step...", 0.8)
-
-            else:
-                print(f"[DEBUG] [WARN] No Next/Review/Submit button at step {step_counter}. Stopping.")
-                debug_pause("No buttons found, stopping...", 0.5)
-                break
-    
-            # Check if we hit the max steps limit
-            if step_counter > max_steps:
-                logger.debug("Reached maximum steps without completion - possible infinite loop", max_steps=max_steps)
-                remove_from_json(job_url)
-                return False
-                break
-
-            time.sleep(config.DELAYS["step_processing"])
-            step_counter += 1
+        # Whether or not Submit was reached, the confirmation check below decides success
+        _walk_modal_steps(job_page, job_url=job_url)
         
         # Pause after completing all steps
         debug_pause("All steps completed, checking for submission confirmation...", 0.5)
@@ -721,16 +990,11 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
         # [OK] Confirm submission (LinkedIn sometimes refreshes the job page after submission)
         success = False
         try:
-            job_page.wait_for_timeout(config.TIMEOUTS["dom_refresh"])  # small wait for DOM to refresh
-
-            # Check for confirmation using centralized selectors
-            confirmation_selectors = config.LINKEDIN_SELECTORS["application_status"]["confirmation"]
-            for i, selector in enumerate(confirmation_selectors):
-                if job_page.locator(selector).count() > 0:
-                    logger.info("Application submitted", confirmation_method=i+1)
-                    success = True
-                    break
-
+            # One combined selector over all confirmation indicators; returns as soon
+            # as any of them is visible instead of a fixed wait plus one count() each
+            if _wait_for_confirmation(job_page, config.TIMEOUTS["dom_refresh"]):
+                logger.info("Application submitted")
+                success = True
             else:
                 logger.warning("No explicit confirmation detected - submission status uncertain")
                 success = False  # <-- mark as failed instead of assuming success
@@ -742,6 +1006,7 @@ def apply_to_job(job_page: Page, resume_path: str, job_url: str) -> bool:
                 # [OK] Remove from JSON only if verified success
         if success:
             remove_from_json(job_url)
+            _save_storage_state_once(job_page)
 
 
 
@@ -12,6 +12,16 @@ from typing import Any, Dict, Optional
 from pathlib import Path
 # Removed circular import - will import debug functions locally when needed
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    """JSONRenderer serializer backed by orjson, decoded once for stdlib handlers."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
 
 def configure_structlog(
     log_level: str = "INFO",
@@ -59,7 +69,10 @@ def configure_structlog(
     if debug_mode:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     else:
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     
     # Configure structlog
     structlog.configure(
@@ -266,6 +279,8 @@ def debug_stop(message: str, **context: Any) -> None:
             elif choice == 's':
                 logger.debug("User chose to skip remaining debug stops")
                 os.environ['SKIP_DEBUG_STOPS'] = 'true'
+                from src.debug_config import DebugConfig
+                DebugConfig.reload()
             else:
                 logger.debug("User chose to continue")
                 
@@ -38,6 +38,13 @@ import json
 import time
 import os
 import sys
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from src.logging_config import get_logger, log_function_call, log_error_context, log_job_context, log_browser_context, debug_pause, debug_stop, debug_checkpoint, debug_skip_stops
 
 logger = get_logger(__name__)
@@ -705,7 +712,7 @@ def scrape_jobs_from_search(
         logger.info("Loading personal information")
         try:
             with open(personal_info_path, "r", encoding="utf-8") as f:
-                personal_info = yaml.safe_load(f)
+                personal_info = yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             logger.error("Could not load personal info", file_path=personal_info_path, error=str(e))
             return []
@@ -14,6 +14,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from src.logging_config import get_logger, log_function_call, log_error_context
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = get_logger(__name__)
 
 class FileHandler:
@@ -36,7 +42,7 @@ class FileHandler:
         """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
         except FileNotFoundError:
             logger.error(f"YAML file not found: {file_path}")
             raise
@@ -61,7 +67,7 @@ class FileHandler:
         """
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
             return True
         except Exception as e:
             logger.error(f"Error saving YAML to {file_path}: {e}")
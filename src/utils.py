@@ -1,9 +1,14 @@
-import random, time, json, os
+import atexit, random, time, json, os
 from src.job_parser import parse_job_card, wait_for_job_cards_to_hydrate
 from src.shared_utils import FileHandler, TextProcessor, DelayManager
 from src.logging_config import get_logger, log_function_call, log_error_context, debug_stop, debug_checkpoint, debug_skip_stops
 import src.config as config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 logger = get_logger(__name__)
 
 def clean_text(text: str) -> str:
@@ -14,8 +19,66 @@ def normalize_skill(skill: str) -> str:
     """Normalize skill names for consistent matching."""
     return TextProcessor.normalize_skill(skill)
 
+# Job URL queue: processed jobs are dropped from job_urls.json in batches
+JOB_URLS_PATH = "job_urls.json"
+
+def _read_job_urls():
+    """Parse job_urls.json, preferring orjson."""
+    with open(JOB_URLS_PATH, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _write_job_urls(urls) -> None:
+    """Write job_urls.json via a temp file + os.replace so a crash never truncates it."""
+    if orjson is not None:
+        payload = orjson.dumps(urls, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(urls, indent=2).encode("utf-8")
+    tmp_path = JOB_URLS_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, JOB_URLS_PATH)
+
+# URLs to drop from job_urls.json, applied in one rewrite instead of one per job
+_PENDING_REMOVALS = set()
+# Flush after this many queued removals to bound what a hard crash can lose
+_FLUSH_EVERY = 10
+
+def flush_job_url_removals() -> None:
+    """
+    Rewrite job_urls.json without the queued URLs. The file is re-read first,
+    so links saved by other code since the last flush are kept.
+    Anything that re-reads job_urls.json during a run must call this first,
+    or it will see URLs that were already processed.
+    """
+    if not _PENDING_REMOVALS:
+        return
+    try:
+        urls = _read_job_urls()
+        remaining = [url for url in urls if url not in _PENDING_REMOVALS]
+        if len(remaining) != len(urls):
+            _write_job_urls(remaining)
+            logger.info("Removed job URLs from job_urls.json", count=len(urls) - len(remaining))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Could not remove job URLs from job_urls.json", count=len(_PENDING_REMOVALS), error=str(e))
+        return
+    _PENDING_REMOVALS.clear()
+
+atexit.register(flush_job_url_removals)
+
+def remove_from_json(url: str) -> None:
+    """Queue a job URL for removal from job_urls.json so it doesn't get retried."""
+    _PENDING_REMOVALS.add(url)
+    logger.debug("Queued job URL for removal from job_urls.json", url=url)
+    if len(_PENDING_REMOVALS) >= _FLUSH_EVERY:
+        flush_job_url_removals()
+
 def load_existing_job_links(filename="job_urls.json") -> set:
     """Load previously saved job links from JSON file, return as set."""
+    # Apply queued removals first so already-processed jobs aren't returned
+    flush_job_url_removals()
     try:
         existing = FileHandler.load_json(filename)
         if existing:
@@ -38,6 +101,8 @@ def save_job_links(job_links, filename="job_urls.json"):
 
 def clean_existing_jobs(page, filename="job_urls.json"):
     """Removes jobs from job_urls.json that have already been applied for."""
+    # Apply queued removals first so already-processed jobs aren't revisited
+    flush_job_url_removals()
     if not os.path.exists(filename):
         return []
 
@@ -254,6 +254,18 @@ class TestAppSettings:
         assert settings.linkedin_password == "password123"
         assert settings.max_jobs == 15  # Explicitly set value
         assert settings.debug == False  # Default value
+    
+    def test_assignment_validated_only_in_debug(self):
+        """Test that assignments are re-validated when the loaded settings have debug on."""
+        debug_settings = AppSettings(linkedin_email="test@example.com", linkedin_password="password123", debug=True)
+        with pytest.raises(ValueError):
+            debug_settings.max_jobs = "not a number"
+        debug_settings.max_jobs = "20"
+        assert debug_settings.max_jobs == 20
+        
+        settings = AppSettings(linkedin_email="test@example.com", linkedin_password="password123", debug=False)
+        settings.max_jobs = 30
+        assert settings.max_jobs == 30
 
 
 class TestConfigManager:
@@ -426,6 +438,31 @@ class TestConfigManager:
         config_manager = ConfigManager.from_dict(config_data)
         assert config_manager.validate_credentials() == False
 
+    def test_model_dump_round_trip(self):
+        """Test that model_dump output round-trips through validation."""
+        timeouts = TimeoutConfig(page_load=60000)
+        assert TimeoutConfig.model_validate(timeouts.model_dump(mode="python")) == timeouts
+        assert timeouts.model_dump(exclude_unset=True) == {"page_load": 60000}
+
+        retry_config = RetryConfig(max_attempts=5, retry_delay=2.5)
+        dumped = retry_config.model_dump(mode="python")
+        assert dumped["max_steps"] == 10
+        assert RetryConfig(**dumped) == retry_config
+
+    def test_from_trusted_dict(self):
+        """Test building a ConfigManager from a previous model_dump without validation."""
+        timeouts = TimeoutConfig(page_load=60000)
+        settings = AppSettings(linkedin_email="test@example.com", linkedin_password="password123", max_jobs=7)
+        config_manager = ConfigManager.from_trusted_dict({
+            "settings": settings.model_dump(mode="python"),
+            "timeouts": timeouts.model_dump(mode="python"),
+        })
+        
+        assert isinstance(config_manager.settings, AppSettings)
+        assert config_manager.max_jobs == 7
+        assert config_manager.timeouts == timeouts
+        assert config_manager.retry_config == RetryConfig()
+
 
 class TestConfigMigration:
     """Test ConfigMigration class."""
@@ -466,6 +503,62 @@ class TestConfigMigration:
         assert 'easy_apply' in selectors
         assert selectors['login']['username'] == 'input[id="username"]'
 
+    def test_migrate_from_old_config_returns_plain_copies(self):
+        """Test that each migration call returns its own mutable dict/list tree."""
+        first = ConfigMigration.migrate_from_old_config()
+        assert isinstance(first["linkedin_selectors"]["login"], dict)
+        assert isinstance(first["question_config"]["skip_questions"], list)
+        
+        first["settings"]["max_jobs"] = -1
+        first["question_config"]["skip_questions"].append("extra")
+        second = ConfigMigration.migrate_from_old_config()
+        assert second["settings"]["max_jobs"] != -1
+        assert "extra" not in second["question_config"]["skip_questions"]
+    
+    def test_migrate_from_old_config_tracks_env(self):
+        """Test that a changed migration env var is picked up despite caching."""
+        with patch.dict(os.environ, {"MAX_JOBS": "21"}):
+            assert ConfigMigration.migrate_from_old_config()["settings"]["max_jobs"] == 21
+        with patch.dict(os.environ, {"MAX_JOBS": "22"}):
+            assert ConfigMigration.migrate_from_old_config()["settings"]["max_jobs"] == 22
+    
+    def test_dotenv_loaded_once_without_env_marker(self):
+        """Test that .env is loaded once per process and no marker leaks into os.environ."""
+        import src.config_migration as config_migration
+        
+        with patch.object(config_migration, "_dotenv_loaded", False), \
+                patch.object(config_migration, "load_dotenv") as load_dotenv:
+            config_migration._load_dotenv_once()
+            config_migration._load_dotenv_once()
+            assert load_dotenv.call_count == 1
+            
+            # An explicit env file is always loaded
+            config_migration._load_dotenv_once(Path("custom.env"))
+            assert load_dotenv.call_count == 2
+        assert "_DOTENV_LOADED" not in os.environ
+    
+    def test_migration_bool_flags_match_legacy_parsing(self):
+        """Test that only 'true' (any case) enables a flag, as in the old config and debug_config."""
+        with patch.dict(os.environ, {"DEBUG": "TRUE", "HEADLESS_MODE": "yes", "AUTO_APPLY": "1"}):
+            migrated = ConfigMigration.migrate_from_old_config()
+        assert migrated["settings"]["debug"] is True
+        assert migrated["settings"]["headless_mode"] is False
+        assert migrated["settings"]["auto_apply"] is False
+        assert migrated["browser_config"]["headless"] is False
+        
+        with patch.dict(os.environ, {"DEBUG": "enabled"}):
+            assert ConfigMigration.migrate_from_old_config()["settings"]["debug"] is False
+    
+    def test_compat_migration_end_to_end(self):
+        """Test that migration output goes through full validation in config_compat."""
+        import src.config_compat as config_compat
+        
+        previous_manager = config_compat._config_manager
+        # The migration output has no personal_info, so validation must reject it
+        with pytest.raises(ValueError, match="personal_info"):
+            config_compat.migrate_from_old_config()
+        assert config_compat._config_manager is previous_manager
+
 
 class TestAppConfig:
     """Test AppConfig class."""
@@ -533,7 +626,115 @@ class TestAppConfig:
             assert config.keyword_weights.tech == ["Python", "JavaScript"]
             assert config.settings.linkedin_email == "test@example.com"
             assert config.settings.linkedin_password == "testpassword"  # Use actual environment value
+    
+    def test_load_from_files_revalidates_only_changed_personal_info(self):
+        """Test that unchanged personal info skips validation and edits are revalidated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            personal_info_data = {
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": "john.doe@example.com",
+                "phone": "(555) 123-4567",
+                "address": {
+                    "street": "123 Main St",
+                    "city": "Atlanta",
+                    "state": "GA",
+                    "zip": "30309"
+                },
+                "linkedin": "https://www.linkedin.com/in/john-doe",
+                "job_history": [],
+                "education": [{
+                    "degree": "BS",
+                    "institution": "Georgia Tech",
+                    "location": "Atlanta, GA",
+                    "graduation_date": "05-2020"
+                }],
+                "references": []
+            }
+            personal_info_path = temp_path / "personal_info.yaml"
+            with open(personal_info_path, 'w') as f:
+                yaml.dump(personal_info_data, f)
+            
+            import src.config_schemas as config_schemas
+            with patch.object(config_schemas, "_CACHE_DIR", temp_path / "cache"):
+                first = AppConfig.load_from_files(personal_info_path=personal_info_path)
+                # The stamp lives in the cache dir, not next to the user's file
+                assert not (temp_path / ".personal_info.validated").exists()
+                assert config_schemas._validated_stamp_path(personal_info_path).exists()
+                
+                second = AppConfig.load_from_files(personal_info_path=personal_info_path)
+                assert second.personal_info.model_dump() == first.personal_info.model_dump()
+                assert second.personal_info.education[0].institution == "Georgia Tech"
+                
+                personal_info_data["email"] = "not-an-email"
+                with open(personal_info_path, 'w') as f:
+                    yaml.dump(personal_info_data, f)
+                os.utime(personal_info_path, ns=(0, 0))
+                with pytest.raises(ValueError):
+                    AppConfig.load_from_files(personal_info_path=personal_info_path)
+    
+    def test_validation_stamp_includes_schema_version(self):
+        """Test that a schema change invalidates a previously written stamp."""
+        import src.config_schemas as config_schemas
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "personal_info.yaml"
+            path.write_text("first_name: John\n")
+            stamp = config_schemas._personal_info_stamp(path)
+            with patch.object(config_schemas, "_schema_version", lambda: "changed"):
+                assert config_schemas._personal_info_stamp(path) != stamp
+
+
 
+class TestConfigCache:
+    """Test the on-disk AppConfig cache in config_manager."""
+    
+    def _build_config(self, temp_dir: Path) -> AppConfig:
+        personal_info_path = temp_dir / "personal_info.yaml"
+        with open(personal_info_path, 'w') as f:
+            yaml.dump({
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": "john.doe@example.com",
+                "phone": "(555) 123-4567",
+                "address": {"street": "123 Main St", "city": "Atlanta", "state": "GA", "zip": "30309"},
+                "linkedin": "https://www.linkedin.com/in/john-doe",
+                "job_history": [],
+                "education": [],
+                "references": [],
+            }, f)
+        import src.config_schemas as config_schemas
+        with patch.object(config_schemas, "_CACHE_DIR", temp_dir / "cache"):
+            return AppConfig.load_from_files(personal_info_path=personal_info_path)
+    
+    def test_cache_round_trip_excludes_credentials(self, temp_dir):
+        """Test that settings are not pickled and are re-read from the environment on a hit."""
+        import pickle
+        import src.config_manager as config_manager_module
+        
+        cache_path = temp_dir / "cache" / "app_config.pickle"
+        with patch.object(config_manager_module, "_CONFIG_CACHE_PATH", cache_path), \
+                patch.dict(os.environ, {"LINKEDIN_EMAIL": "cached@example.com", "LINKEDIN_PASSWORD": "s3cret-value"}):
+            config_manager_module._store_cached_config("key", self._build_config(temp_dir))
+            
+            raw = cache_path.read_bytes()
+            assert b"s3cret-value" not in raw
+            assert pickle.loads(raw)[1].settings is None
+            
+            with patch.dict(os.environ, {"LINKEDIN_PASSWORD": "rotated"}):
+                loaded = config_manager_module._load_cached_config("key")
+            assert loaded.settings.linkedin_password == "rotated"
+            assert loaded.personal_info.first_name == "John"
+            assert config_manager_module._load_cached_config("other-key") is None
+    
+    def test_cache_key_tracks_schema_version(self):
+        """Test that a schema/code change produces a different cache key."""
+        import src.config_manager as config_manager_module
+        
+        key = config_manager_module._config_cache_key()
+        with patch.object(config_manager_module, "_config_schema_version", lambda: "changed"):
+            assert config_manager_module._config_cache_key() != key
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,153 @@
+"""
+Unit tests for cookie_manager.py: cached loading of the cookie file.
+
+load_cookies keeps parsed cookie files in _COOKIE_CACHE; these tests check
+that the cache is reused only while the file is unchanged, that callers
+can't mutate the cached entries, and that expiry is still enforced.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.cookie_manager as cookie_manager
+from src.cookie_manager import CookieManager
+
+
+@pytest.fixture
+def manager(temp_dir):
+    """A CookieManager on its own cookie file, starting with an empty cache."""
+    cookie_manager._COOKIE_CACHE.clear()
+    yield CookieManager(cookies_file=str(temp_dir / "cookies.json"), logger=MagicMock())
+    cookie_manager._COOKIE_CACHE.clear()
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count how many times the cookie file is actually parsed."""
+    calls = []
+    real_loads = cookie_manager._loads_json
+
+    def loads(data):
+        calls.append(1)
+        return real_loads(data)
+
+    monkeypatch.setattr(cookie_manager, "_loads_json", loads)
+    return calls
+
+
+def _write_cookies(manager, cookies):
+    manager.cookies_file.write_text(json.dumps(cookies))
+
+
+def _cookie(name, expires=-1):
+    return {"name": name, "value": "v", "domain": ".linkedin.com", "path": "/", "expires": expires}
+
+
+class TestLoadCookies:
+    """Test CookieManager.load_cookies caching and validation."""
+
+    def test_missing_file_returns_none(self, manager):
+        """Test that a missing cookie file loads as None."""
+        assert manager.load_cookies() is None
+
+    def test_unchanged_file_is_parsed_once(self, manager, count_parses):
+        """Test that repeated loads of an unchanged file reuse the cached parse."""
+        _write_cookies(manager, [_cookie("li_at"), _cookie("JSESSIONID")])
+
+        first = manager.load_cookies()
+        second = manager.load_cookies()
+
+        assert first == second
+        assert len(count_parses) == 1
+
+    def test_changed_file_is_reparsed(self, manager, count_parses):
+        """Test that a rewritten cookie file invalidates the cached parse."""
+        _write_cookies(manager, [_cookie("li_at")])
+        manager.load_cookies()
+
+        _write_cookies(manager, [_cookie("li_at"), _cookie("bcookie")])
+        loaded = manager.load_cookies()
+
+        assert [c["name"] for c in loaded] == ["li_at", "bcookie"]
+        assert len(count_parses) == 2
+
+    def test_mutating_result_does_not_touch_cache(self, manager):
+        """Test that callers get copies they can modify without corrupting later loads."""
+        _write_cookies(manager, [_cookie("li_at")])
+
+        loaded = manager.load_cookies()
+        loaded[0]["value"] = "tampered"
+        loaded.append(_cookie("extra"))
+
+        assert manager.load_cookies() == [_cookie("li_at")]
+
+    def test_expired_cookies_are_filtered_and_saved(self, manager):
+        """Test that expired cookies are dropped and the file is rewritten without them."""
+        now = time.time()
+        _write_cookies(manager, [_cookie("old", expires=now - 60), _cookie("li_at", expires=now + 3600)])
+
+        loaded = manager.load_cookies()
+
+        assert [c["name"] for c in loaded] == ["li_at"]
+        assert [c["name"] for c in json.loads(manager.cookies_file.read_text())] == ["li_at"]
+
+    def test_all_expired_deletes_file(self, manager):
+        """Test that a file of only expired cookies is deleted and loads as None."""
+        _write_cookies(manager, [_cookie("old", expires=time.time() - 60)])
+
+        assert manager.load_cookies() is None
+        assert not manager.cookies_file.exists()
+
+    def test_far_expiry_skips_revalidation(self, manager, monkeypatch):
+        """Test that cached cookies far from expiry are returned without revalidating."""
+        _write_cookies(manager, [_cookie("li_at", expires=time.time() + 3600)])
+        manager.load_cookies()
+
+        validate = MagicMock(side_effect=manager._validate_cookies)
+        monkeypatch.setattr(manager, "_validate_cookies", validate)
+        manager.load_cookies()
+
+        validate.assert_not_called()
+
+    def test_cached_cookie_expiring_is_revalidated(self, manager, monkeypatch):
+        """Test that a cached cookie past its expiry is filtered on the next load."""
+        now = time.time()
+        _write_cookies(manager, [_cookie("short", expires=now + 3600), _cookie("li_at")])
+        assert len(manager.load_cookies()) == 2
+
+        # The file is unchanged, but the clock has moved past the short cookie's expiry
+        monkeypatch.setattr(cookie_manager.time, "time", lambda: now + 7200)
+        loaded = manager.load_cookies()
+
+        assert [c["name"] for c in loaded] == ["li_at"]
+
+
+class TestSaveCookies:
+    """Test CookieManager.save_cookies write coalescing."""
+
+    def test_identical_save_is_coalesced(self, manager, monkeypatch):
+        """Test that saving the same cookies again right away skips the write."""
+        cookies = [_cookie("li_at")]
+        assert manager.save_cookies(cookies) is True
+
+        replace = MagicMock()
+        monkeypatch.setattr(cookie_manager.os, "replace", replace)
+        assert manager.save_cookies([_cookie("li_at")]) is True
+
+        replace.assert_not_called()
+
+    def test_mutated_list_is_rewritten(self, manager):
+        """Test that re-saving a list the caller changed in place writes the change."""
+        cookies = [_cookie("li_at")]
+        manager.save_cookies(cookies)
+
+        cookies[0]["value"] = "refreshed"
+        cookies.append(_cookie("bcookie"))
+        assert manager.save_cookies(cookies) is True
+
+        saved = json.loads(manager.cookies_file.read_text())
+        assert [c["name"] for c in saved] == ["li_at", "bcookie"]
+        assert saved[0]["value"] == "refreshed"
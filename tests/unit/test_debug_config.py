@@ -0,0 +1,65 @@
+"""
+Unit tests for debug_config.py: environment snapshot and getter results.
+"""
+
+import pytest
+
+import src.debug_config as debug_config
+
+
+@pytest.fixture
+def reload_env(monkeypatch):
+    """Set debug environment variables and reload the global DebugConfig."""
+    def apply(**env):
+        for name in ("DEBUG", "REDUCE_DEBUG_PAUSES", "SKIP_DEBUG_STOPS", "ENABLE_GRAPHQL_DEBUG"):
+            monkeypatch.setenv(name, env.get(name, "false"))
+        debug_config.DebugConfig.reload()
+
+    yield apply
+    monkeypatch.undo()
+    debug_config.DebugConfig.reload()
+
+
+class TestDebugConfig:
+    """Test DebugConfig reload and the module-level getters."""
+
+    def test_reload_updates_module_flags(self, reload_env):
+        """Test that reload() refreshes DEBUG_MODE and the existing instance."""
+        instance = debug_config.get_debug_config()
+
+        reload_env(DEBUG="true", REDUCE_DEBUG_PAUSES="true")
+
+        assert debug_config.DEBUG_MODE is True
+        assert debug_config.is_debug_mode() is True
+        assert debug_config.should_reduce_debug_pauses() is True
+        assert instance.debug_mode is True
+
+    def test_debug_off_has_no_args_or_timeouts(self, reload_env):
+        """Test that debug-only settings are empty when DEBUG is off."""
+        reload_env()
+
+        assert debug_config.get_debug_browser_args() == []
+        assert debug_config.get_debug_timeouts() == {}
+
+    def test_reduced_pauses_halve_delays(self, reload_env):
+        """Test that REDUCE_DEBUG_PAUSES halves every debug delay."""
+        reload_env()
+        full = debug_config.get_debug_delays()
+        reload_env(REDUCE_DEBUG_PAUSES="true")
+
+        assert debug_config.get_debug_delays() == {k: v * 0.5 for k, v in full.items()}
+
+    def test_getters_return_fresh_copies(self, reload_env):
+        """Test that callers can modify getter results without affecting later calls."""
+        reload_env(DEBUG="true")
+
+        args = debug_config.get_debug_browser_args()
+        args.append("--extra")
+        timeouts = debug_config.get_debug_timeouts()
+        timeouts["page_load"] = 0
+        route = debug_config.get_debug_route_handling()
+        route["block_images"] = True
+
+        assert "--extra" not in debug_config.get_debug_browser_args()
+        assert debug_config.get_debug_timeouts()["page_load"] == 30.0
+        assert debug_config.get_debug_route_handling()["block_images"] is False
@@ -0,0 +1,106 @@
+"""
+Unit tests for easy_apply.py: the Easy Apply modal step walker.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+import src.easy_apply as easy_apply
+
+
+def _step_state(action, heading, index=0, text_labels=()):
+    """A _STEP_STATE_JS result for a step with no upload field or radio/dropdown questions."""
+    return {
+        "action": action,
+        "index": index,
+        "heading": heading,
+        "upload": False,
+        "textLabels": list(text_labels),
+        "questions": {"radios": [], "dropdowns": []},
+    }
+
+
+@pytest.fixture
+def modal_page(monkeypatch):
+    """A mock page whose step state reads return the queued states in order."""
+    selectors = {
+        "submit": ["button.submit"], "review": ["button.review"], "next": ["button.next"],
+        "upload_button": "label.upload", "radio_fieldset": "fieldset", "radio_input": "input",
+        "dropdown": "select", "dropdown_label": "label", "follow_checkbox": [], "follow_label": [],
+    }
+    monkeypatch.setattr(easy_apply, "_step_selectors", lambda: selectors)
+    monkeypatch.setattr(easy_apply, "_footer_probe_groups", lambda: {})
+    monkeypatch.setattr(easy_apply.config, "RETRY_CONFIG", {"max_steps": 10}, raising=False)
+
+    page = MagicMock()
+    page.states = []
+
+    def wait_for_function(script, arg=None, timeout=None):
+        if script != easy_apply._STEP_STATE_JS:
+            return MagicMock()  # step-change wait after a click
+        if not page.states:
+            raise PlaywrightTimeout("no footer")
+        handle = MagicMock()
+        handle.json_value.return_value = page.states.pop(0)
+        return handle
+
+    page.wait_for_function.side_effect = wait_for_function
+    return page
+
+
+class TestWalkModalSteps:
+    """Test the Easy Apply step walker's dispatch and stop conditions."""
+
+    def test_walks_until_submit(self, modal_page):
+        """Test that Next and Review are followed until Submit is clicked."""
+        modal_page.states = [
+            _step_state("next", "Contact info"),
+            _step_state("next", "Resume"),
+            _step_state("review", "Additional questions"),
+            _step_state("submit", "Review your application"),
+        ]
+
+        assert easy_apply._walk_modal_steps(modal_page) is True
+        assert modal_page.states == []
+
+    def test_allows_more_steps_than_max_steps(self, modal_page):
+        """Test that forms longer than max_steps still reach Submit."""
+        modal_page.states = [_step_state("next", f"Step {i}") for i in range(25)]
+        modal_page.states.append(_step_state("submit", "Review your application"))
+
+        assert easy_apply._walk_modal_steps(modal_page) is True
+
+    def test_stops_at_step_backstop(self, modal_page):
+        """Test that a modal that keeps changing without Submit stops at 3x max_steps."""
+        modal_page.states = [_step_state("next", f"Step {i}") for i in range(40)]
+
+        assert easy_apply._walk_modal_steps(modal_page) is False
+        assert len(modal_page.states) == 40 - 30
+
+    def test_same_heading_text_only_steps_still_submit(self, modal_page):
+        """Test that two different text-only steps sharing a heading aren't mistaken for a repeat."""
+        modal_page.states = [
+            _step_state("next", "Additional questions", text_labels=["Years of Python experience"]),
+            _step_state("review", "Additional questions", text_labels=["Desired salary"]),
+            _step_state("submit", "Review your application"),
+        ]
+
+        assert easy_apply._walk_modal_steps(modal_page) is True
+
+    def test_stops_when_modal_does_not_advance(self, modal_page):
+        """Test that seeing the same step twice stops the walk instead of looping."""
+        modal_page.states = [
+            _step_state("next", "Contact info"),
+            _step_state("next", "Contact info"),
+            _step_state("submit", "Review your application"),
+        ]
+
+        assert easy_apply._walk_modal_steps(modal_page) is False
+        # The submit state was never read
+        assert len(modal_page.states) == 1
+
+    def test_stops_without_footer_buttons(self, modal_page):
+        """Test that a step without Submit/Review/Next ends the walk."""
+        assert easy_apply._walk_modal_steps(modal_page) is False
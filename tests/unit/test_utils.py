@@ -0,0 +1,81 @@
+"""
+Unit tests for utils.py: the job URL removal queue.
+
+remove_from_json batches removals in memory; these tests check when
+job_urls.json is actually rewritten and that readers never see URLs that
+were already processed.
+"""
+
+import json
+
+import pytest
+
+import src.utils as utils
+
+
+@pytest.fixture
+def job_urls_file(temp_dir, monkeypatch):
+    """Run each test against its own job_urls.json with an empty removal queue."""
+    monkeypatch.chdir(temp_dir)
+    utils._PENDING_REMOVALS.clear()
+    path = temp_dir / utils.JOB_URLS_PATH
+    yield path
+    utils._PENDING_REMOVALS.clear()
+
+
+def _write_urls(path, urls):
+    path.write_text(json.dumps(urls))
+
+
+def _read_urls(path):
+    return json.loads(path.read_text())
+
+
+class TestRemoveFromJson:
+    """Test batched removal of job URLs."""
+
+    def test_removal_is_queued_until_flush(self, job_urls_file):
+        """Test that a single removal doesn't rewrite the file until flushed."""
+        _write_urls(job_urls_file, ["a", "b", "c"])
+
+        utils.remove_from_json("b")
+        assert _read_urls(job_urls_file) == ["a", "b", "c"]
+
+        utils.flush_job_url_removals()
+        assert _read_urls(job_urls_file) == ["a", "c"]
+        assert not utils._PENDING_REMOVALS
+
+    def test_flushes_after_batch_size(self, job_urls_file):
+        """Test that the file is rewritten once _FLUSH_EVERY removals are queued."""
+        urls = [f"https://example.com/job/{i}" for i in range(utils._FLUSH_EVERY + 2)]
+        _write_urls(job_urls_file, urls)
+
+        for url in urls[:utils._FLUSH_EVERY]:
+            utils.remove_from_json(url)
+
+        assert _read_urls(job_urls_file) == urls[utils._FLUSH_EVERY:]
+        assert not utils._PENDING_REMOVALS
+
+    def test_flush_keeps_links_added_since_queueing(self, job_urls_file):
+        """Test that links saved by other code after queueing survive the flush."""
+        _write_urls(job_urls_file, ["a", "b"])
+        utils.remove_from_json("a")
+
+        _write_urls(job_urls_file, ["a", "b", "new"])
+        utils.flush_job_url_removals()
+
+        assert _read_urls(job_urls_file) == ["b", "new"]
+
+    def test_flush_without_file_is_noop(self, job_urls_file):
+        """Test that flushing with no job_urls.json neither fails nor creates it."""
+        utils.remove_from_json("a")
+        utils.flush_job_url_removals()
+
+        assert not job_urls_file.exists()
+
+    def test_readers_do_not_see_queued_removals(self, job_urls_file):
+        """Test that re-reading job_urls.json mid-run skips already-processed URLs."""
+        _write_urls(job_urls_file, ["a", "b", "c"])
+        utils.remove_from_json("a")
+
+        assert utils.load_existing_job_links(str(job_urls_file)) == {"b", "c"}